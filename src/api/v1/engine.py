@@ -9,7 +9,7 @@ import pandas as pd
 import pandera as pa
 
 from .endpoints import ProcessResult, TransformRequest, ValidationConfig, ValidationResponse
-from ...combine_runner import run_combine as _run_combine
+from ...combine_runner import concat_to_parquet, find_combine_files, run_combine as _run_combine
 from ...connectors import read_sql_with_template
 from ...schema import OutputSchema
 from ...templates import Template, read_excel_with_template
@@ -256,6 +256,7 @@ class DataEngine:
         """
         Orchestrates the full ETL pipeline: Ingest -> Normalize -> Transform -> Validate.
         Note: This does NOT handle file movement (Archive/Quarantine).
+        ``template`` is only read, so one cached instance can be shared across files.
         """
         try:
             raw_df = self.read_source(source_path, template)
@@ -308,6 +309,17 @@ class DataEngine:
             strict_schema=strict_schema,
         )
 
+    def run_combine_to_parquet(
+        self,
+        input_dir: Path,
+        output_path: Path,
+        pattern: str = "*.parquet",
+        strict_schema: bool = False,
+    ) -> int:
+        """Concat outputs straight into a parquet file without holding the combined frame."""
+        files = find_combine_files(input_dir, pattern)
+        return concat_to_parquet(files, output_path, strict_schema=strict_schema)
+
 
 _ENGINE = DataEngine()
 
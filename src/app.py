@@ -42,7 +42,8 @@ from .connectors import (
     save_connections,
     test_connection,
 )
-from .combine_runner import run_combine, read_frame
+from .combine_runner import concat_to_parquet, find_combine_files, run_combine
+from .exporter import write_excel
 
 DEFAULT_PREVIEW_ROWS = 10
 
@@ -125,7 +126,7 @@ class ExcelTemplateApp:
         self.saved_schema_snapshot: Dict[str, List[str]] | None = None
 
         # Connection store (in-memory)
-        self.connections: List[ConnectionConfig] = load_connections()
+        self.connections: Dict[str, ConnectionConfig] = {c.name: c for c in load_connections()}
 
         self.source_type: str = "excel"
         self._build_ui()
@@ -1260,8 +1261,8 @@ class ExcelTemplateApp:
         for col in preview_df.columns:
             self.schema_preview_tree.heading(col, text=str(col))
             self.schema_preview_tree.column(col, width=120)
-        for row in preview_df.itertuples(index=False):
-            self.schema_preview_tree.insert("", tk.END, values=list(row))
+        for row in preview_df.itertuples(index=False, name=None):
+            self.schema_preview_tree.insert("", tk.END, values=row)
 
         if update_schema or use_heuristics:
             headers = [str(col) for col in preview_df.columns if str(col).strip()]
@@ -1351,8 +1352,8 @@ class ExcelTemplateApp:
                 heading_style = None
             self._set_heading(self.final_preview_tree, col, str(col), heading_style)
             self.final_preview_tree.column(col, width=120)
-        for row in df.itertuples(index=False):
-            self.final_preview_tree.insert("", tk.END, values=list(row))
+        for row in df.itertuples(index=False, name=None):
+            self.final_preview_tree.insert("", tk.END, values=row)
 
     def _update_diff_labels(self, prev_fields: List[str], new_headers: List[str]) -> None:
         """Update missing/extra labels comparing previous fields to new headers."""
@@ -1385,6 +1386,20 @@ class ExcelTemplateApp:
         except tk.TclError:
             tree.heading(col, text=text)
 
+    def _fill_preview_tree(self, tree: ttk.Treeview, df: pd.DataFrame, width: int = 100) -> None:
+        """Replace tree contents with df, hiding headings while columns and rows are configured."""
+        tree.configure(show="")
+        try:
+            tree.delete(*tree.get_children())
+            tree["columns"] = list(df.columns)
+            for col in df.columns:
+                tree.heading(col, text=col)
+                tree.column(col, width=width, stretch=False)
+            for row in df.itertuples(index=False, name=None):
+                tree.insert("", tk.END, values=row)
+        finally:
+            tree.configure(show="headings")
+
     def _load_schema_from_excel(self) -> None:
         """Read headers from a sample Excel/CSV file and treat them as the target schema."""
         path = filedialog.askopenfilename(
@@ -1586,6 +1601,7 @@ class ExcelTemplateApp:
                         header_row=opts["header"],
                         skiprows=opts["skiprows"],
                         nrows=DEFAULT_PREVIEW_ROWS,
+                        copy=opts["combine_sheets"],
                     )
                     if headers:
                         if opts["combine_sheets"]:
@@ -1629,13 +1645,7 @@ class ExcelTemplateApp:
 
             if preview_df is not None and isinstance(preview_df, pd.DataFrame):
                 self.preview_df = preview_df
-                self.preview_tree.delete(*self.preview_tree.get_children())
-                self.preview_tree["columns"] = list(preview_df.columns)
-                for col in preview_df.columns:
-                    self.preview_tree.heading(col, text=col)
-                    self.preview_tree.column(col, width=100)
-                for row in preview_df.itertuples(index=False):
-                    self.preview_tree.insert("", tk.END, values=list(row))
+                self._fill_preview_tree(self.preview_tree, preview_df, width=100)
 
             if warnings:
                 messagebox.showwarning("Sheet mismatch", "\n".join(warnings))
@@ -1680,6 +1690,7 @@ class ExcelTemplateApp:
                         header_row=opts["header"],
                         skiprows=opts["skiprows"],
                         nrows=DEFAULT_PREVIEW_ROWS,
+                        copy=opts["combine_sheets"],
                     )
                     if self.columns:
                         if opts["combine_sheets"]:
@@ -1701,14 +1712,7 @@ class ExcelTemplateApp:
             self.preview_df = df
 
             # Update Treeview
-            self.preview_tree.delete(*self.preview_tree.get_children())
-            self.preview_tree["columns"] = list(df.columns)
-            for col in df.columns:
-                self.preview_tree.heading(col, text=col)
-                self.preview_tree.column(col, width=100)
-
-            for row in df.itertuples(index=False):
-                self.preview_tree.insert("", tk.END, values=list(row))
+            self._fill_preview_tree(self.preview_tree, df, width=100)
         except:
             pass
 
@@ -2089,8 +2093,9 @@ class ExcelTemplateApp:
         if not self.connection_listbox.curselection():
             return
         idx = self.connection_listbox.curselection()[0]
-        if idx < len(self.connections):
-            self.connection_name_var.set(self.connections[idx].name)
+        names = list(self.connections)
+        if idx < len(names):
+            self.connection_name_var.set(names[idx])
 
     def preview_connection(self) -> None:
         if not self.connections:
@@ -2121,13 +2126,7 @@ class ExcelTemplateApp:
             self.columns_listbox.insert(tk.END, c)
 
         self.preview_df = df
-        self.preview_tree.delete(*self.preview_tree.get_children())
-        self.preview_tree["columns"] = list(df.columns)
-        for col in df.columns:
-            self.preview_tree.heading(col, text=col)
-            self.preview_tree.column(col, width=120)
-        for row in df.itertuples(index=False):
-            self.preview_tree.insert("", tk.END, values=list(row))
+        self._fill_preview_tree(self.preview_tree, df, width=120)
 
         self._update_info_panel()
 
@@ -2135,9 +2134,10 @@ class ExcelTemplateApp:
         target_name = self.connection_name_var.get()
         if not target_name and self.connection_listbox.curselection():
             idx = self.connection_listbox.curselection()[0]
-            if idx < len(self.connections):
-                target_name = self.connections[idx].name
-        return next((c for c in self.connections if c.name == target_name), None)
+            names = list(self.connections)
+            if idx < len(names):
+                target_name = names[idx]
+        return self.connections.get(target_name)
 
     def _use_mapped_keys(self) -> None:
         """Prefill combine keys from mapped target fields."""
@@ -2175,6 +2175,8 @@ class ExcelTemplateApp:
             "Port": tk.StringVar(),
         }
 
+        # Size is fixed above, so skip per-widget geometry propagation while building the form.
+        top.grid_propagate(False)
         for idx, (label, var) in enumerate(fields.items()):
             ttk.Label(top, text=label).grid(row=idx, column=0, padx=8, pady=4, sticky="w")
             show = "*" if "Password" in label else None
@@ -2223,9 +2225,8 @@ class ExcelTemplateApp:
                 port=int(payload["Port"]) if payload.get("Port") else None,
             )
             # Replace if same name exists
-            self.connections = [c for c in self.connections if c.name != cfg.name]
-            self.connections.append(cfg)
-            save_connections(self.connections)
+            self.connections[cfg.name] = cfg
+            save_connections(list(self.connections.values()))
             self.connection_name_var.set(cfg.name)
             self._refresh_connection_list()
             top.destroy()
@@ -2236,13 +2237,13 @@ class ExcelTemplateApp:
         ttk.Button(top, text="Cancel", command=top.destroy).grid(
             row=len(fields), column=1, padx=8, pady=10, sticky="e"
         )
+        top.update_idletasks()
 
     def _refresh_connection_list(self) -> None:
         self.connection_listbox.delete(0, tk.END)
-        for conn in self.connections:
-            name = conn.name
-            conn_type = conn.type
-            self.connection_listbox.insert(tk.END, f"{name} [{conn_type}]")
+        labels = [f"{conn.name} [{conn.type}]" for conn in self.connections.values()]
+        if labels:
+            self.connection_listbox.insert(tk.END, *labels)
 
     def _load_from_file(self, path: Path):
         tpl = load_template(path)
@@ -2292,22 +2293,12 @@ class ExcelTemplateApp:
             return
 
         def work():
-            if mode == "merge":
-                files = sorted(input_dir.glob(pattern))
-                if not files:
-                    raise ValueError(f"No files found in {input_dir} matching {pattern}")
-                missing_files = []
-                for f in files:
-                    cols = list(read_frame(f).columns)
-                    missing = [k for k in keys if k not in cols]
-                    if missing:
-                        missing_files.append(f"{f.name} (missing: {', '.join(missing)})")
-                if missing_files:
-                    msg = "Some files are missing merge keys (use canonical names like order_id):\n"
-                    msg += "\n".join(missing_files[:5])
-                    if len(missing_files) > 5:
-                        msg += f"\n...and {len(missing_files)-5} more"
-                    raise ValueError(msg)
+            # Merge-key checks run inside run_combine from file headers before any rows are read.
+            out_path = Path(self.combine_output_var.get() or "data/output/Master_Sales_Report.xlsx")
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            if mode == "concat" and out_path.suffix.lower() == ".parquet":
+                files = find_combine_files(input_dir, pattern)
+                return concat_to_parquet(files, out_path, strict_schema=strict), out_path
 
             df = run_combine(
                 input_dir=input_dir,
@@ -2316,20 +2307,19 @@ class ExcelTemplateApp:
                 keys=keys,
                 how=how,
                 strict_schema=strict,
+                use_processes=True,
             )
-            out_path = Path(self.combine_output_var.get() or "data/output/Master_Sales_Report.xlsx")
-            out_path.parent.mkdir(parents=True, exist_ok=True)
             if out_path.suffix.lower() == ".parquet":
                 df.to_parquet(out_path, index=False)
             else:
-                df.to_excel(out_path, index=False)
-            return df, out_path
+                write_excel(df, out_path)
+            return len(df), out_path
 
         def on_success(result):
-            df, out_path = result
+            rows, out_path = result
             messagebox.showinfo(
                 "Combine complete",
-                f"Combined {len(df)} rows using mode={mode}. Saved to {out_path}.",
+                f"Combined {rows} rows using mode={mode}. Saved to {out_path}.",
             )
             self._clear_busy("Combine complete")
 
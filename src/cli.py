@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import shutil
 import sys
 from pathlib import Path
@@ -12,7 +13,8 @@ import pandas as pd
 
 from .api.v1.engine import DataEngine, warn_on_schema_diff
 from .connectors import check_sqlalchemy_available
-from .templates import Template, load_template, locate_template, locate_streamlit_template
+from .exporter import export_dataset, write_excel
+from .templates import Template, load_template_cached, locate_template, locate_streamlit_template
 from .youtube import (
     YouTubeAuthError,
     add_engagement_metrics,
@@ -37,8 +39,16 @@ def setup_logging(log_to_file: bool = False) -> None:
         logging.basicConfig(level=logging.INFO, format=log_format)
 
 
-def _iter_files(input_path: Path):
-    return list(input_path.glob("*.xlsx")) + list(input_path.glob("*.csv"))
+_INPUT_SUFFIXES = (".xlsx", ".csv")
+
+
+def _iter_files(input_path: Path) -> list[Path]:
+    with os.scandir(input_path) as entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(_INPUT_SUFFIXES) and entry.is_file()
+        ]
 
 
 def _save_output(df: pd.DataFrame, output_path: Path) -> Path:
@@ -46,20 +56,22 @@ def _save_output(df: pd.DataFrame, output_path: Path) -> Path:
     if output_path.suffix.lower() == ".parquet":
         df.to_parquet(output_path, index=False)
         return output_path
-    excel_path = output_path.with_suffix(".xlsx")
-    df.to_excel(excel_path, index=False)
-    return excel_path
+    return write_excel(df, output_path.with_suffix(".xlsx"))
 
 
 def run_batch_process(
     target_dir: str,
-    output_fmt: str = "xlsx",
+    output_fmt: str = "parquet",
     fail_on_missing: bool = False,
     fail_on_extra: bool = False,
     validation_level: str = "coerce",
     use_streamlit_templates: bool = False,
 ) -> None:
-    """Scans input folder (and optional company subfolders), applies templates, moves files."""
+    """Scans input folder (and optional company subfolders), applies templates, moves files.
+
+    Per-file outputs default to parquet so ``combine`` can read them cheaply; the
+    combined report is the single place where an xlsx is produced.
+    """
 
     input_path = Path(target_dir)
     engine = DataEngine()
@@ -80,7 +92,7 @@ def run_batch_process(
                 if use_streamlit_templates
                 else locate_template(dir_path)
             )
-            template = load_template(tpl_path)
+            template = load_template_cached(tpl_path)
             if template.source_type == "sql":
                 check_sqlalchemy_available()
                 output_path = out_dir / f"sql_clean.{output_fmt}"
@@ -115,7 +127,7 @@ def run_batch_process(
                         if use_streamlit_templates
                         else locate_template(file_path.parent, stem=file_path.stem)
                     )
-                    template = load_template(tpl_path)
+                    template = load_template_cached(tpl_path)
                 except FileNotFoundError:
                     logging.warning(f"No template found for {file_path.name}. Skipping.")
                     continue
@@ -164,6 +176,16 @@ def run_batch_process(
 
 def run_combine_cli(input_dir: str, pattern: str, mode: str, keys: list[str], how: str, strict: bool, output: str) -> None:
     engine = DataEngine()
+    out_path = Path(output)
+    if mode == "concat" and out_path.suffix.lower() == ".parquet":
+        rows = engine.run_combine_to_parquet(
+            input_dir=Path(input_dir),
+            output_path=out_path,
+            pattern=pattern,
+            strict_schema=strict,
+        )
+        logging.info("Combined %d rows using mode=%s. Saved to %s", rows, mode, out_path)
+        return
     df = engine.run_combine(
         input_dir=Path(input_dir),
         pattern=pattern,
@@ -172,9 +194,8 @@ def run_combine_cli(input_dir: str, pattern: str, mode: str, keys: list[str], ho
         how=how,
         strict_schema=strict,
     )
-    out_path = Path(output)
-    _save_output(df, out_path)
-    logging.info("Combined %d rows using mode=%s. Saved to %s", len(df), mode, out_path)
+    saved = _save_output(df, out_path)
+    logging.info("Combined %d rows using mode=%s. Saved to %s", len(df), mode, saved)
 
 
 def run_youtube_cli(
@@ -214,9 +235,10 @@ def run_youtube_cli(
 
     combined = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=[])
     if not combined.empty:
-        combined = combined.drop_duplicates(subset=["video_id"])
+        # combined is freshly built here, so dedupe and sort can reuse it in place
+        combined.drop_duplicates(subset=["video_id"], inplace=True, ignore_index=True)
         combined = add_engagement_metrics(combined)
-        combined = combined.sort_values(by=["view_count", "like_count"], ascending=False)
+        combined.sort_values(by=["view_count", "like_count"], ascending=False, inplace=True, ignore_index=True)
         summaries = build_summaries(combined, top_n=top_n)
     else:
         summaries = {"detail": combined}
@@ -227,11 +249,7 @@ def run_youtube_cli(
     saved = _save_output(combined, out_path)
 
     if summary_output and summaries:
-        summary_path = Path(summary_output)
-        summary_path.parent.mkdir(parents=True, exist_ok=True)
-        with pd.ExcelWriter(summary_path) as writer:
-            for name, frame in summaries.items():
-                frame.to_excel(writer, sheet_name=name[:31], index=False)
+        summary_path = write_excel(summaries, Path(summary_output))
         logging.info("Wrote summary workbook to %s", summary_path)
 
     export_meta = {
@@ -260,7 +278,12 @@ def build_parser() -> argparse.ArgumentParser:
 
     run = sub.add_parser("run", help="Process files in batch mode.")
     run.add_argument("--target-dir", type=str, default=str(DEFAULT_INPUT), help="Directory to scan for files")
-    run.add_argument("--output-fmt", choices=["xlsx", "parquet"], default="xlsx")
+    run.add_argument(
+        "--output-fmt",
+        choices=["xlsx", "parquet"],
+        default="parquet",
+        help="Per-file output format; parquet keeps the batch -> combine chain fast.",
+    )
     run.add_argument("--fail-on-missing", action="store_true")
     run.add_argument("--fail-on-extra", action="store_true")
     run.add_argument("--validation-level", choices=["off", "coerce", "contract"], default="coerce")
@@ -272,7 +295,7 @@ def build_parser() -> argparse.ArgumentParser:
 
     combine = sub.add_parser("combine", help="Combine cleaned outputs.")
     combine.add_argument("--input-dir", type=str, default="data/output")
-    combine.add_argument("--pattern", type=str, default="*.xlsx")
+    combine.add_argument("--pattern", type=str, default="*.parquet")
     combine.add_argument("--mode", choices=["concat", "merge"], default="concat")
     combine.add_argument("--keys", type=str, default="")
     combine.add_argument("--how", choices=["inner", "outer", "left", "right"], default="inner")
@@ -307,8 +330,8 @@ def build_parser() -> argparse.ArgumentParser:
     yt.add_argument(
         "--format",
         type=str,
-        default="xlsx,jsonl",
-        help="Comma-separated formats to export (xlsx,jsonl,parquet).",
+        default="parquet,feather",
+        help="Comma-separated formats to export (parquet,feather,jsonl,jsonl_gz,xlsx); xlsx is opt-in.",
     )
 
     return parser
@@ -2,50 +2,316 @@
 
 from __future__ import annotations
 
+import fnmatch
+import importlib.util
+import multiprocessing
+import os
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from openpyxl import load_workbook
+
+# python-calamine parses xlsx/xls in Rust; fall back to pandas' default engine when absent.
+_EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") is not None else None
+
+
+def read_columns(path: Path) -> list[str]:
+    """Return column names for a combine input without loading its rows."""
+    suffix = path.suffix.lower()
+    if suffix == ".parquet":
+        return list(pq.read_schema(path).names)
+    if suffix == ".xlsx":
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            worksheet = workbook.worksheets[0]
+            header = next(worksheet.iter_rows(max_row=1, values_only=True), ())
+        finally:
+            workbook.close()
+        return [str(value) for value in header if value is not None]
+    if suffix == ".xls":
+        return [str(col) for col in pd.read_excel(path, nrows=0).columns]
+    raise ValueError(f"Unsupported file type: {path.suffix}")
 
 
 def read_frame(path: Path) -> pd.DataFrame:
     if path.suffix.lower() in {".xls", ".xlsx"}:
-        return pd.read_excel(path)
+        return pd.read_excel(path, engine=_EXCEL_ENGINE)
     if path.suffix.lower() == ".parquet":
         return pd.read_parquet(path)
     raise ValueError(f"Unsupported file type: {path.suffix}")
 
 
-def concat_frames(files: List[Path], strict_schema: bool) -> pd.DataFrame:
-    frames = []
-    base_cols: list[str] | None = None
-    for f in files:
-        df = read_frame(f)
-        if strict_schema:
-            if base_cols is None:
-                base_cols = list(df.columns)
-            elif list(df.columns) != base_cols:
-                raise ValueError(f"Schema mismatch in {f.name}")
-        frames.append(df)
+def _worker_count(file_count: int) -> int:
+    raw = os.environ.get("DF_COMBINE_WORKERS", "")
+    try:
+        workers = int(raw) if raw else (os.cpu_count() or 1)
+    except ValueError:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, file_count))
+
+
+def _map_files(reader, files: List[Path]) -> list:
+    workers = _worker_count(len(files))
+    if workers <= 1:
+        return [reader(f) for f in files]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(reader, files))
+
+
+def read_frames(files: List[Path]) -> List[pd.DataFrame]:
+    """Read files concurrently (DF_COMBINE_WORKERS threads), preserving input order."""
+    return _map_files(read_frame, files)
+
+
+def _check_strict_schema(files: List[Path], columns: List[List[str]]) -> None:
+    base_cols: tuple[str, ...] | None = None
+    base_key = 0
+    for f, cols in zip(files, columns):
+        cols_tuple = tuple(cols)
+        cols_key = hash(cols_tuple)
+        if base_cols is None:
+            base_cols, base_key = cols_tuple, cols_key
+            continue
+        if cols_key == base_key and cols_tuple == base_cols:
+            continue
+        current, base = set(cols_tuple), set(base_cols)
+        missing = [c for c in base_cols if c not in current]
+        extra = [c for c in cols_tuple if c not in base]
+        detail = f"missing {missing}, extra {extra}" if missing or extra else "column order differs"
+        raise ValueError(f"Schema mismatch in {f.name}: {detail}")
+
+
+def check_schema_headers(files: List[Path]) -> None:
+    """Raise ValueError naming the first file whose columns differ (headers only, no rows)."""
+    _check_strict_schema(files, [read_columns(f) for f in files])
+
+
+def _concat_parquet(files: List[Path], strict_schema: bool) -> pd.DataFrame:
+    tables: List[pa.Table] = _map_files(pq.read_table, files)
+    if strict_schema:
+        _check_strict_schema(files, [t.column_names for t in tables])
+    try:
+        combined = pa.concat_tables(tables, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Column types that Arrow cannot unify still concat fine as object columns in pandas.
+        return pd.concat([t.to_pandas() for t in tables], ignore_index=True, sort=False)
+    del tables
+    df = combined.to_pandas(self_destruct=True)
+    df.index = pd.RangeIndex(len(df))
+    return df
+
+
+# Below this many Excel inputs, process start-up costs more than parallel parsing saves.
+_PROCESS_SHARD_MIN_FILES = 8
+
+
+def _concat_shard(files: List[Path], shard_path: str) -> str:
+    concat_frames(files, strict_schema=False).to_parquet(shard_path, index=False)
+    return shard_path
+
+
+def _concat_in_processes(files: List[Path], strict_schema: bool) -> pd.DataFrame | None:
+    """Parse Excel shards in worker processes and join their parquet output; None on failure."""
+    if strict_schema:
+        _check_strict_schema(files, [read_columns(f) for f in files])
+    workers = _worker_count(len(files))
+    size = -(-len(files) // workers)
+    chunks = [files[i : i + size] for i in range(0, len(files), size)]
+    with tempfile.TemporaryDirectory(prefix="df_combine_") as tmp:
+        targets = [str(Path(tmp) / f"shard_{i}.parquet") for i in range(len(chunks))]
+        try:
+            # The GUI runs combines on a background thread; forking a threaded process can
+            # deadlock on locks held by other threads, so workers are spawned instead.
+            with ProcessPoolExecutor(
+                max_workers=len(chunks), mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                shards = list(pool.map(_concat_shard, chunks, targets))
+        except (BrokenProcessPool, OSError, pa.ArrowInvalid, pa.ArrowTypeError):
+            return None
+        return _concat_parquet([Path(p) for p in shards], strict_schema=False)
+
+
+def concat_frames(
+    files: List[Path], strict_schema: bool, use_processes: bool = False
+) -> pd.DataFrame:
+    """Stack files vertically; ``use_processes`` shards large Excel inputs across processes."""
+    if all(f.suffix.lower() == ".parquet" for f in files):
+        return _concat_parquet(files, strict_schema)
+    if use_processes and len(files) > _PROCESS_SHARD_MIN_FILES and _worker_count(len(files)) > 1:
+        combined = _concat_in_processes(files, strict_schema)
+        if combined is not None:
+            return combined
+    return stack_frames(files, read_frames(files), strict_schema)
+
+
+def stack_frames(
+    files: List[Path], frames: List[pd.DataFrame], strict_schema: bool
+) -> pd.DataFrame:
+    """Concat frames already read from ``files`` (used for naming schema mismatches)."""
+    if strict_schema:
+        _check_strict_schema(files, [list(df.columns) for df in frames])
     return pd.concat(frames, ignore_index=True, sort=False)
 
 
+def _join_on_keys(frames: List[pd.DataFrame], keys: List[str], how: str) -> pd.DataFrame | None:
+    """Inner-join all frames in one pass on a shared key index; None when a merge fold is needed.
+
+    Only inner joins with identical key dtypes qualify: left/outer joins reindex with NaN
+    (turning integer columns into floats) and mismatched key types would align silently
+    where ``merge`` raises or upcasts.
+    """
+    if how != "inner":
+        return None
+    key_dtypes = frames[0].dtypes[keys].tolist()
+    if any(df.dtypes[keys].tolist() != key_dtypes for df in frames[1:]):
+        return None
+    seen = set(frames[0].columns)
+    for df in frames[1:]:
+        values = set(df.columns).difference(keys)
+        if values & seen:
+            return None  # overlapping value columns need the per-step suffixes
+        seen |= values
+    indexed = [df.set_index(keys) for df in frames]
+    if not all(df.index.is_unique for df in indexed):
+        return None
+    joined = indexed[0].join(indexed[1:], how="inner")
+    order = list(frames[0].columns) + [c for df in frames[1:] for c in df.columns if c not in keys]
+    return joined.reset_index()[order]
+
+
+def check_merge_keys(files: List[Path], keys: List[str]) -> None:
+    """Raise ValueError naming files whose headers lack any merge key (no row data is read)."""
+    _check_keys_present([(f.name, read_columns(f)) for f in files], keys)
+
+
+def _check_keys_present(named_columns: List[tuple[str, List[str]]], keys: List[str]) -> None:
+    missing_files = []
+    for name, columns in named_columns:
+        cols = set(columns)
+        missing = [k for k in keys if k not in cols]
+        if missing:
+            missing_files.append(f"{name} (missing: {', '.join(missing)})")
+    if missing_files:
+        msg = "Some files are missing merge keys (use canonical names like order_id):\n"
+        msg += "\n".join(missing_files[:5])
+        if len(missing_files) > 5:
+            msg += f"\n...and {len(missing_files)-5} more"
+        raise ValueError(msg)
+
+
 def merge_frames(files: List[Path], keys: List[str], how: str) -> pd.DataFrame:
     if not keys:
         raise ValueError("Merge mode requires at least one key.")
-    frames = [read_frame(f) for f in files]
+    if len(files) > 1:
+        check_merge_keys(files, keys)
+    return join_frames(read_frames(files), keys, how)
+
+
+def join_frames(
+    frames: List[pd.DataFrame], keys: List[str], how: str, files: List[Path] | None = None
+) -> pd.DataFrame:
+    """Merge frames already in memory; ``files`` names them when checking for missing keys."""
+    if not keys:
+        raise ValueError("Merge mode requires at least one key.")
+    if files is not None and len(frames) > 1:
+        _check_keys_present([(f.name, list(df.columns)) for f, df in zip(files, frames)], keys)
+    if len(frames) > 2:
+        joined = _join_on_keys(frames, keys, how)
+        if joined is not None:
+            return joined
     merged = frames[0]
     for idx, df in enumerate(frames[1:], start=2):
-        missing_left = [k for k in keys if k not in merged.columns]
-        missing_right = [k for k in keys if k not in df.columns]
-        if missing_left or missing_right:
-            raise ValueError(
-                f"Missing merge keys. Left missing {missing_left}, right missing {missing_right}."
-            )
         merged = merged.merge(df, on=keys, how=how, suffixes=("", f"_{idx}"))
     return merged
 
 
+def _widens_losslessly(source: pa.Schema, target: pa.Schema) -> bool:
+    """True when casting ``source`` to ``target`` only fills null columns or turns ints into floats."""
+    return source.names == target.names and all(
+        s.type == t.type
+        or pa.types.is_null(s.type)
+        or (pa.types.is_integer(s.type) and pa.types.is_floating(t.type))
+        for s, t in zip(source, target)
+    )
+
+
+def _stream_parquet(files: List[Path], out_path: Path) -> int | None:
+    """Append each input to ``out_path``; None when an input's types differ from the first's."""
+    writer: pq.ParquetWriter | None = None
+    rows = 0
+    try:
+        for f in files:
+            if f.suffix.lower() == ".parquet":
+                table = pq.read_table(f)
+            else:
+                table = pa.Table.from_pandas(read_frame(f), preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(out_path, table.schema)
+            elif not table.schema.equals(writer.schema, check_metadata=False):
+                # Any other cast (e.g. "007" -> 7.0) would differ from the in-memory concat.
+                if not _widens_losslessly(table.schema, writer.schema):
+                    return None
+                table = table.cast(writer.schema)
+            writer.write_table(table)
+            rows += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def concat_to_parquet(files: List[Path], out_path: Path, strict_schema: bool) -> int:
+    """Concatenate files into a parquet file one input at a time and return the row count.
+
+    Inputs are streamed when they share one column layout and their column types
+    match the first file's (up to null -> T and int -> float); otherwise the
+    in-memory concat is used.
+    """
+    columns = [read_columns(f) for f in files]
+    if strict_schema:
+        _check_strict_schema(files, columns)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    if all(cols == columns[0] for cols in columns[1:]):
+        try:
+            rows = _stream_parquet(files, out_path)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            rows = None
+        if rows is not None:
+            return rows
+        out_path.unlink(missing_ok=True)
+    df = concat_frames(files, strict_schema=strict_schema)
+    df.to_parquet(out_path, index=False)
+    return len(df)
+
+
+@lru_cache(maxsize=32)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    return re.compile(fnmatch.translate(pattern), flags)
+
+
+def find_combine_files(input_dir: Path, pattern: str) -> List[Path]:
+    if any(sep in pattern for sep in ("/", "\\")) or "**" in pattern:
+        files = sorted(input_dir.glob(pattern))
+    elif not input_dir.is_dir():
+        files = []
+    else:
+        matcher = _compile_pattern(pattern).match
+        with os.scandir(input_dir) as entries:
+            files = sorted(Path(e.path) for e in entries if matcher(e.name) and e.is_file())
+    if not files:
+        raise FileNotFoundError(f"No files found in {input_dir} with pattern {pattern}")
+    return files
+
+
 def run_combine(
     input_dir: Path,
     pattern: str = "*.xlsx",
@@ -53,10 +319,9 @@ def run_combine(
     keys: List[str] | None = None,
     how: str = "inner",
     strict_schema: bool = False,
+    use_processes: bool = False,
 ) -> pd.DataFrame:
-    files = sorted(input_dir.glob(pattern))
-    if not files:
-        raise FileNotFoundError(f"No files found in {input_dir} with pattern {pattern}")
+    files = find_combine_files(input_dir, pattern)
     if mode == "concat":
-        return concat_frames(files, strict_schema=strict_schema)
+        return concat_frames(files, strict_schema=strict_schema, use_processes=use_processes)
     return merge_frames(files, keys or [], how=how)
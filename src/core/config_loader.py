@@ -2,27 +2,59 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import yaml
 
+try:  # libyaml-backed parser when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - pure-Python PyYAML build
+    from yaml import SafeLoader as _YamlLoader
+
+_BASE_SYNONYMS = Path("src/config.yaml")
+_USER_SYNONYMS = Path("src/config.user.yaml")
+
 
 def _load_yaml(path: Path) -> dict:
     if not path.exists():
         return {}
-    payload = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    payload = yaml.load(path.read_bytes(), Loader=_YamlLoader) or {}
     return payload if isinstance(payload, dict) else {}
 
 
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def synonyms_signature(
+    base_path: Path | None = None, user_path: Path | None = None
+) -> Tuple[int, int]:
+    """Return the synonym files' mtimes; changes whenever ``load_synonyms`` would reload."""
+    base = base_path or _BASE_SYNONYMS
+    user = user_path or _USER_SYNONYMS
+    return _mtime_ns(base), _mtime_ns(user)
+
+
 def load_synonyms(
     base_path: Path | None = None, user_path: Path | None = None
 ) -> Dict[str, List[str]]:
-    base = base_path or Path("src/config.yaml")
-    user = user_path or Path("src/config.user.yaml")
+    """Return merged synonyms; the dict is cached per file mtimes and must not be mutated."""
+    base = base_path or _BASE_SYNONYMS
+    user = user_path or _USER_SYNONYMS
+    return _load_synonyms_cached(str(base), _mtime_ns(base), str(user), _mtime_ns(user))
+
 
+@lru_cache(maxsize=8)
+def _load_synonyms_cached(
+    base_str: str, _base_mtime: int, user_str: str, _user_mtime: int
+) -> Dict[str, List[str]]:
     merged: Dict[str, List[str]] = {}
-    for path in (base, user):
+    for path in (Path(base_str), Path(user_str)):
         payload = _load_yaml(path)
         syns = payload.get("synonyms", {}) if isinstance(payload, dict) else {}
         if not isinstance(syns, dict):
@@ -36,19 +68,14 @@ def load_synonyms(
             merged.setdefault(str(key), [])
             merged[key].extend(items)
 
-    # Deduplicate while preserving order
+    # Deduplicate case-insensitively, keeping the first spelling in order
     for key, values in merged.items():
-        seen = set()
-        deduped = []
+        first_seen: Dict[str, str] = {}
         for item in values:
-            lowered = item.lower()
-            if lowered in seen:
-                continue
-            seen.add(lowered)
-            deduped.append(item)
-        merged[key] = deduped
+            first_seen.setdefault(item.lower(), item)
+        merged[key] = list(first_seen.values())
 
     return merged
 
 
-__all__ = ["load_synonyms"]
+__all__ = ["load_synonyms", "synonyms_signature"]
@@ -2,16 +2,53 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import threading
+from collections import OrderedDict
 from typing import Any
 
 from ..templates import HeaderCell, Template
 
+_TEMPLATE_CACHE_SIZE = 32
+_TEMPLATE_CACHE: OrderedDict[str, Template] = OrderedDict()
+_TEMPLATE_CACHE_LOCK = threading.Lock()
+
+
+def _recipe_key(recipe: dict[str, Any]) -> str | None:
+    try:
+        payload = json.dumps(recipe, sort_keys=True, default=str)
+    except TypeError:  # mixed-type keys cannot be sorted; skip caching
+        return None
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
 
 def recipe_to_template(recipe: dict[str, Any]) -> Template:
-    """Convert a Streamlit recipe payload into a Template."""
+    """Convert a Streamlit recipe payload into a Template.
+
+    Results are cached by recipe content, so an unchanged recipe returns the
+    same shared Template across reruns; treat it as read-only.
+    """
     if not isinstance(recipe, dict):
         raise ValueError("Recipe must be a dictionary.")
 
+    key = _recipe_key(recipe)
+    if key is None:
+        return _build_template(recipe)
+    with _TEMPLATE_CACHE_LOCK:
+        cached = _TEMPLATE_CACHE.get(key)
+        if cached is not None:
+            _TEMPLATE_CACHE.move_to_end(key)
+            return cached
+    template = _build_template(recipe)
+    with _TEMPLATE_CACHE_LOCK:
+        _TEMPLATE_CACHE[key] = template
+        while len(_TEMPLATE_CACHE) > _TEMPLATE_CACHE_SIZE:
+            _TEMPLATE_CACHE.popitem(last=False)
+    return template
+
+
+def _build_template(recipe: dict[str, Any]) -> Template:
     mappings = recipe.get("mappings", {}) or {}
     column_mappings = {
         str(source): str(target)
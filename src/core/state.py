@@ -6,6 +6,8 @@ from typing import Any, Iterable, Mapping
 
 import streamlit as st
 
+_MISSING = object()
+
 
 class SessionState:
     """Wrapper around st.session_state with defaults and reset support."""
@@ -18,8 +20,9 @@ class SessionState:
     def __getattr__(self, name: str) -> Any:
         if name == "_defaults":
             return super().__getattribute__(name)
-        if name in st.session_state:
-            return st.session_state[name]
+        value = st.session_state.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
         if name in self._defaults:
             value = self._defaults[name]
             st.session_state[name] = value
@@ -2,24 +2,35 @@
 
 from __future__ import annotations
 
+import hashlib
 import io
 
 import pandas as pd
 import streamlit as st
 
+from ..services.io import excel_sheet_names, read_excel
 
-@st.cache_data(show_spinner=False)
-def list_excel_sheets(data: bytes) -> list[str]:
-    with pd.ExcelFile(io.BytesIO(data)) as xf:
-        return list(xf.sheet_names)
+
+def content_digest(data: bytes) -> str:
+    """Digest identifying an upload; compute once per upload and pass as ``content_hash``."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
 
 
+# The ``_data`` parameters are excluded from Streamlit's cache key (leading
+# underscore) so large uploads aren't re-hashed on every rerun; ``content_hash``
+# stands in for them.
 @st.cache_data(show_spinner=False)
+def list_excel_sheets(_data: bytes, content_hash: str) -> list[str]:
+    return excel_sheet_names(io.BytesIO(_data))
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
 def read_uploaded_dataframe(
-    data: bytes,
+    _data: bytes,
+    content_hash: str,
     filename: str,
     header_row: int | None,
-    skiprows: list[int],
+    skiprows: list[int] | tuple[int, ...],
     delimiter: str,
     encoding: str,
     sheet_name: str | int | None,
@@ -27,21 +38,21 @@ def read_uploaded_dataframe(
 ) -> pd.DataFrame:
     """Read a preview DataFrame from uploaded bytes."""
     if filename.lower().endswith((".xlsx", ".xls")):
-        return pd.read_excel(
-            io.BytesIO(data),
+        return read_excel(
+            io.BytesIO(_data),
             sheet_name=sheet_name or 0,
             header=header_row,
-            skiprows=skiprows,
+            skiprows=list(skiprows),
             nrows=nrows,
         )
     return pd.read_csv(
-        io.BytesIO(data),
+        io.BytesIO(_data),
         header=header_row,
-        skiprows=skiprows,
+        skiprows=list(skiprows),
         sep=delimiter,
         encoding=encoding,
         nrows=nrows,
     )
 
 
-__all__ = ["list_excel_sheets", "read_uploaded_dataframe"]
+__all__ = ["content_digest", "list_excel_sheets", "read_uploaded_dataframe"]
@@ -2,20 +2,34 @@
 
 from __future__ import annotations
 
+import gzip
+import importlib.util
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Iterable, Mapping
 
 import pandas as pd
+import pyarrow as pa
+from openpyxl.utils import get_column_letter
+from pyarrow import feather
 
+# xlsxwriter is write-only and much faster than openpyxl; pandas picks openpyxl when absent.
+_XLSX_ENGINE = "xlsxwriter" if importlib.util.find_spec("xlsxwriter") is not None else None
+_JSONL_CHUNK_ROWS = 100_000
 
-def _null_pct(series: pd.Series) -> float:
-    total = len(series)
-    if total == 0:
-        return 0.0
-    return round(series.isna().sum() * 100.0 / total, 2)
+
+def write_excel(sheets: pd.DataFrame | Mapping[str, pd.DataFrame], path: Path) -> Path:
+    """Write a frame (or sheet name -> frame mapping) to xlsx with the fastest available engine."""
+    frames = {"Sheet1": sheets} if isinstance(sheets, pd.DataFrame) else sheets
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with pd.ExcelWriter(path, engine=_XLSX_ENGINE) as writer:
+        for name, frame in frames.items():
+            frame.to_excel(writer, sheet_name=str(name)[:31], index=False)
+    return path
 
 
 def _dtype_map(df: pd.DataFrame) -> dict[str, str]:
@@ -23,62 +37,81 @@ def _dtype_map(df: pd.DataFrame) -> dict[str, str]:
 
 
 def _metrics(df: pd.DataFrame) -> dict:
-    dup_count = df.duplicated().sum() if not df.empty else 0
+    total = len(df)
+    dup_count = df.duplicated().to_numpy().sum() if not df.empty else 0
+    if total:
+        null_pct = (df.isna().sum(axis=0) * 100.0 / total).round(2)
+        null_map = {col: float(pct) for col, pct in zip(df.columns, null_pct.to_numpy())}
+    else:
+        null_map = {col: 0.0 for col in df.columns}
     return {
         "rows": int(df.shape[0]),
         "columns": int(df.shape[1]),
         "dtypes": _dtype_map(df),
-        "null_pct": {col: _null_pct(df[col]) for col in df.columns},
+        "null_pct": null_map,
         "duplicates": int(dup_count),
     }
 
 
 def _write_excel(df: pd.DataFrame, meta: dict, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with pd.ExcelWriter(path) as writer:
+    engine = _XLSX_ENGINE or "openpyxl"
+    with pd.ExcelWriter(path, engine=engine) as writer:
         df.to_excel(writer, sheet_name="data", index=False)
         meta_rows = pd.DataFrame([{"key": k, "value": v} for k, v in meta.items()])
         meta_rows.to_excel(writer, sheet_name="meta", index=False)
 
         # Basic formatting: freeze header row and apply autofilter
         data_sheet = writer.sheets["data"]
-        # Some engines (like openpyxl) use attributes, not callables
-        if hasattr(data_sheet, "freeze_panes"):
-            try:
-                data_sheet.freeze_panes = data_sheet["B2"]  # freeze first row
-            except Exception:
-                pass
-        if not df.empty and hasattr(data_sheet, "auto_filter"):
-            try:
-                last_col = df.shape[1]
-                last_row = df.shape[0]
-                data_sheet.auto_filter.ref = f"A1:{chr(ord('A') + last_col - 1)}{last_row+1}"
-            except Exception:
-                pass
-        # Ensure column order is the DataFrame order (default behavior already)
-
-
-def _write_jsonl(df: pd.DataFrame, path: Path) -> None:
+        last_row, last_col = df.shape
+        if engine == "xlsxwriter":
+            data_sheet.freeze_panes(1, 0)
+            if not df.empty:
+                data_sheet.autofilter(0, 0, last_row, last_col - 1)
+        else:
+            data_sheet.freeze_panes = "A2"
+            if not df.empty:
+                data_sheet.auto_filter.ref = f"A1:{get_column_letter(last_col)}{last_row + 1}"
+
+
+def _write_parquet(df: pd.DataFrame, path: Path) -> None:
+    df.to_parquet(path, index=False, compression="zstd", row_group_size=100_000)
+
+
+def write_feather(df: pd.DataFrame, path: Path) -> Path:
+    """Write ``df`` (without its index) as zstd-compressed Feather."""
+    feather.write_feather(pa.Table.from_pandas(df, preserve_index=False), path, compression="zstd")
+    return path
+
+
+def _write_jsonl(df: pd.DataFrame, path: Path, gzip_level: int | None = None) -> None:
+    """Write JSON Lines in row chunks so only one chunk's text is held in memory."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        for _, row in df.iterrows():
-            f.write(json.dumps(row.to_dict(), ensure_ascii=False))
-            f.write("\n")
+    opener = partial(gzip.open, compresslevel=gzip_level) if gzip_level else open
+    with opener(path, "wt", encoding="utf-8") as fh:
+        for start in range(0, len(df), _JSONL_CHUNK_ROWS):
+            text = df.iloc[start : start + _JSONL_CHUNK_ROWS].to_json(
+                orient="records", lines=True, date_format="iso", force_ascii=False
+            )
+            fh.write(text if text.endswith("\n") else text + "\n")
 
 
 def export_dataset(
     df: pd.DataFrame,
     out_dir: str | Path,
-    formats: Iterable[str] = ("xlsx", "jsonl"),
+    formats: Iterable[str] = ("parquet", "feather"),
     meta: Mapping | None = None,
 ) -> dict[str, Path]:
     """
     Export a dataset to the given formats and write a manifest.json.
 
+    Parquet and Feather are the canonical artifacts; xlsx is a report format
+    for people and is only written when requested.
+
     Args:
         df: DataFrame to export.
         out_dir: Output directory.
-        formats: Iterable of formats, any of {"xlsx","jsonl","parquet"}.
+        formats: Iterable of formats, any of {"parquet","feather","jsonl","jsonl_gz","xlsx"}.
         meta: Additional manifest fields (must include run/usage info).
     """
     out_path = Path(out_dir)
@@ -94,22 +127,25 @@ def export_dataset(
 
     manifest["metrics"] = _metrics(df)
 
-    written: dict[str, Path] = {}
-    for fmt in manifest["formats"]:
-        fmt_lower = fmt.lower()
-        if fmt_lower == "xlsx":
-            target = out_path / "data.xlsx"
-            _write_excel(df, manifest, target)
-        elif fmt_lower == "jsonl":
-            target = out_path / "data.jsonl"
-            _write_jsonl(df, target)
-        elif fmt_lower == "parquet":
-            target = out_path / "data.parquet"
-            target.parent.mkdir(parents=True, exist_ok=True)
-            df.to_parquet(target, index=False)
-        else:
-            continue
-        written[fmt_lower] = target
+    writers = {
+        "xlsx": ("data.xlsx", lambda target: _write_excel(df, manifest, target)),
+        "jsonl": ("data.jsonl", lambda target: _write_jsonl(df, target)),
+        "jsonl_gz": ("data.jsonl.gz", lambda target: _write_jsonl(df, target, gzip_level=1)),
+        "parquet": ("data.parquet", lambda target: _write_parquet(df, target)),
+        "feather": ("data.feather", lambda target: write_feather(df, target)),
+    }
+    jobs = {
+        fmt: out_path / writers[fmt][0]
+        for fmt in (f.lower() for f in manifest["formats"])
+        if fmt in writers
+    }
+    # The writers spend most of their time in C code that releases the GIL,
+    # so formats are written concurrently rather than one after another.
+    with ThreadPoolExecutor(max_workers=max(1, len(jobs))) as pool:
+        futures = [pool.submit(writers[fmt][1], target) for fmt, target in jobs.items()]
+        for future in futures:
+            future.result()
+    written: dict[str, Path] = dict(jobs)
 
     manifest_path = out_path / "manifest.json"
     manifest["run_completed_at"] = datetime.now(timezone.utc).isoformat()
@@ -118,4 +154,4 @@ def export_dataset(
     return written
 
 
-__all__ = ["export_dataset"]
+__all__ = ["export_dataset", "write_excel", "write_feather"]
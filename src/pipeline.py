@@ -11,6 +11,7 @@ This module handles the heavy lifting:
 from __future__ import annotations
 
 import logging
+import os
 import shutil
 import traceback
 from pathlib import Path
@@ -21,6 +22,7 @@ import pandera as pa
 
 from .api.v1 import engine
 from .connectors import read_sql_with_template
+from .exporter import write_excel, write_feather
 from .templates import Template, read_excel_with_template
 
 
@@ -70,7 +72,14 @@ def save_quarantine(
 
     dest_file = quarantine_dir / source.name
     try:
-        shutil.copy2(source, dest_file)
+        # Replace rather than write through an existing entry, which may be a
+        # hardlink shared with an archived file.
+        dest_file.unlink(missing_ok=True)
+        try:
+            # Same-filesystem quarantine needs no data copy at all.
+            os.link(source, dest_file)
+        except OSError:
+            shutil.copy2(source, dest_file)
     except Exception:
         pass
 
@@ -125,9 +134,12 @@ def run_pipeline(
     fail_on_missing: bool = False,
     fail_on_extra: bool = False,
     validation_level: str = "coerce",
+    produce_xlsx: bool = False,
 ) -> bool:
     """
     Orchestrate the ETL process for a single file.
+    The validated frame is saved as ``output_path`` with a ``.feather`` suffix;
+    pass ``produce_xlsx=True`` to also write an ``.xlsx`` copy for people.
     Returns True if successful, False if quarantined.
     """
     try:
@@ -139,6 +151,8 @@ def run_pipeline(
         norm_df = normalize(raw_df, template)
 
         clean_df, metrics = transform(norm_df, template)
+        # Arrow-backed columns make validation's null checks and the Feather write cheaper.
+        clean_df = clean_df.convert_dtypes(dtype_backend="pyarrow")
 
         missing, extra = warn_on_schema_diff(clean_df, template, source=file_path if file_path else None)
         if (fail_on_missing and missing) or (fail_on_extra and extra):
@@ -164,16 +178,17 @@ def run_pipeline(
             return False
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        excel_path = output_path.with_suffix(".xlsx")
-        valid_df.to_excel(excel_path, index=False)
+        feather_path = write_feather(valid_df, output_path.with_suffix(".feather"))
+        if produce_xlsx:
+            write_excel(valid_df, output_path.with_suffix(".xlsx"))
 
         report = _build_validation_report(
             file_path, raw_rows, raw_cols, valid_df, metrics, missing, extra, validation_level, template
         )
-        report_path = excel_path.with_suffix(excel_path.suffix + ".validation.txt")
+        report_path = feather_path.with_suffix(feather_path.suffix + ".validation.txt")
         report_path.write_text(report, encoding="utf-8")
 
-        logging.info(f"Pipeline finished. Saved to {excel_path}")
+        logging.info(f"Pipeline finished. Saved to {feather_path}")
         return True
 
     except Exception as e:
@@ -2,26 +2,130 @@
 
 from __future__ import annotations
 
+import hashlib
+import html
+import importlib.util
+import os
+import re
+import zipfile
 from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import BinaryIO, Callable, Iterable, List, Sequence
 
 import pandas as pd
 
+# python-calamine parses xlsx/xls in Rust without building openpyxl's cell DOM,
+# which keeps small preview reads fast on large workbooks.
+_EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") is not None else None
+_SHEET_TAG = re.compile(rb'<(?:\w+:)?sheet\b[^>]*?\sname="([^"]*)"')
+
+# Bounded previews can also be kept on disk (as parquet) so they survive restarts and
+# are shared between app sessions. Opt-in: set DF_PREVIEW_CACHE_DIR to enable.
+_PREVIEW_CACHE_DIR = os.environ.get("DF_PREVIEW_CACHE_DIR", "")
+_PREVIEW_CACHE_MAX_ENTRIES = 64
+
+
+# Input path -> resolved path; Path.resolve() walks every component, which is the
+# dominant cost of a cached preview hit. Relative inputs are keyed by cwd.
+_RESOLVE_CACHE: dict[str, str] = {}
+_RESOLVE_CACHE_MAX_ENTRIES = 256
+
 
 def _file_sig(path: Path) -> tuple[str, float | None]:
-    resolved = Path(path).resolve()
+    key = os.fspath(path)
+    if not os.path.isabs(key):
+        key = os.path.join(os.getcwd(), key)
+    resolved = _RESOLVE_CACHE.get(key)
+    if resolved is None:
+        if len(_RESOLVE_CACHE) >= _RESOLVE_CACHE_MAX_ENTRIES:
+            _RESOLVE_CACHE.clear()
+        resolved = _RESOLVE_CACHE[key] = str(Path(key).resolve())
     try:
-        mtime = resolved.stat().st_mtime
+        mtime = os.stat(resolved).st_mtime
     except OSError:
         mtime = None
-    return str(resolved), mtime
+    return resolved, mtime
 
 
 def _skip_key(skiprows: Sequence[int] | None) -> tuple[int, ...]:
     return tuple(skiprows or ())
 
 
+def read_excel(source: Path | BinaryIO, **kwargs) -> pd.DataFrame:
+    """``pd.read_excel`` on the calamine engine when installed, else pandas' default engine."""
+    if _EXCEL_ENGINE is not None:
+        try:
+            return pd.read_excel(source, engine=_EXCEL_ENGINE, **kwargs)
+        except Exception:
+            # Calamine errors don't carry the messages callers use to detect
+            # mislabeled files; let the default engine succeed or raise instead.
+            if hasattr(source, "seek"):
+                source.seek(0)
+    return pd.read_excel(source, **kwargs)
+
+
+def excel_sheet_names(source: Path | BinaryIO) -> List[str]:
+    """List workbook sheet names without loading any cell data.
+
+    xlsx/xlsm workbooks are zip archives whose sheet names live in
+    ``xl/workbook.xml``; a tag scan there avoids bootstrapping an Excel engine.
+    Binary ``.xls`` files (and anything the scan can't parse) go through ``pd.ExcelFile``.
+    """
+    if zipfile.is_zipfile(source):
+        if hasattr(source, "seek"):
+            source.seek(0)
+        with zipfile.ZipFile(source) as zf:
+            try:
+                workbook_xml = zf.read("xl/workbook.xml")
+            except KeyError:
+                workbook_xml = b""
+        names = [html.unescape(name.decode("utf-8")) for name in _SHEET_TAG.findall(workbook_xml)]
+        if names:
+            return names
+    if hasattr(source, "seek"):
+        source.seek(0)
+    with pd.ExcelFile(source, engine=_EXCEL_ENGINE) as xf:
+        return list(xf.sheet_names)
+
+
+def _prune_preview_cache(cache_dir: Path) -> None:
+    entries = sorted(os.scandir(cache_dir), key=lambda entry: entry.stat().st_mtime)
+    for entry in entries[: max(0, len(entries) - _PREVIEW_CACHE_MAX_ENTRIES)]:
+        try:
+            os.unlink(entry.path)
+        except OSError:
+            pass
+
+
+def _disk_cached(key: tuple, loader: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+    """Return ``loader()``, memoized on disk under ``key`` (which must embed the file mtime)."""
+    if not _PREVIEW_CACHE_DIR:
+        return loader()
+    cache_dir = Path(_PREVIEW_CACHE_DIR)
+    target = cache_dir / f"{hashlib.blake2b(repr(key).encode('utf-8'), digest_size=16).hexdigest()}.parquet"
+    try:
+        return pd.read_parquet(target)
+    except Exception:
+        pass
+    df = loader()
+    # Parquet needs string column names (header=None previews use integers); skip those.
+    if not all(isinstance(col, str) for col in df.columns):
+        return df
+    tmp = target.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(tmp)
+        os.replace(tmp, target)
+        _prune_preview_cache(cache_dir)
+    except Exception:
+        # Unwritable dir or a column pyarrow cannot store (e.g. mixed object types).
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+    return df
+
+
 @lru_cache(maxsize=32)
 def _cached_excel_preview(
     path_str: str,
@@ -32,14 +136,19 @@ def _cached_excel_preview(
     nrows: int | None,
     usecols: tuple[str, ...] | None,
 ) -> pd.DataFrame:
-    return pd.read_excel(
-        Path(path_str),
-        sheet_name=sheet if sheet is not None else 0,
-        header=header_row,
-        skiprows=list(skiprows),
-        nrows=nrows,
-        usecols=list(usecols) if usecols is not None else None,
-    )
+    def load() -> pd.DataFrame:
+        return read_excel(
+            Path(path_str),
+            sheet_name=sheet if sheet is not None else 0,
+            header=header_row,
+            skiprows=list(skiprows),
+            nrows=nrows,
+            usecols=list(usecols) if usecols is not None else None,
+        )
+
+    if _mtime is None or nrows is None:
+        return load()
+    return _disk_cached(("excel", path_str, _mtime, sheet, header_row, skiprows, nrows, usecols), load)
 
 
 @lru_cache(maxsize=32)
@@ -52,14 +161,19 @@ def _cached_csv_preview(
     delimiter: str,
     encoding: str,
 ) -> pd.DataFrame:
-    return pd.read_csv(
-        Path(path_str),
-        header=header_row,
-        skiprows=list(skiprows),
-        nrows=nrows,
-        sep=delimiter,
-        encoding=encoding,
-    )
+    def load() -> pd.DataFrame:
+        return pd.read_csv(
+            Path(path_str),
+            header=header_row,
+            skiprows=list(skiprows),
+            nrows=nrows,
+            sep=delimiter,
+            encoding=encoding,
+        )
+
+    if _mtime is None or nrows is None:
+        return load()
+    return _disk_cached(("csv", path_str, _mtime, header_row, skiprows, nrows, delimiter, encoding), load)
 
 
 def read_preview_frame(
@@ -72,8 +186,13 @@ def read_preview_frame(
     delimiter: str = ",",
     encoding: str = "utf-8",
     usecols: Iterable[str] | None = None,
+    copy: bool = False,
 ) -> pd.DataFrame:
-    """Read a small preview DataFrame with caching to avoid repeated I/O."""
+    """Read a small preview DataFrame with caching to avoid repeated I/O.
+
+    The returned frame is shared with the cache and must be treated as read-only;
+    pass ``copy=True`` when the caller needs to modify it in place.
+    """
     sig = _file_sig(path)
     if source_type == "csv":
         df = _cached_csv_preview(
@@ -115,14 +234,13 @@ def read_preview_frame(
                 )
             else:
                 raise
-    return df.copy()
+    return df.copy() if copy else df
 
 
 @lru_cache(maxsize=16)
 def get_sheet_names(path_str: str, _mtime: float | None) -> List[str]:
     """Cached wrapper to fetch sheet names from a workbook."""
-    with pd.ExcelFile(Path(path_str)) as xf:
-        return list(xf.sheet_names)
+    return excel_sheet_names(Path(path_str))
 
 
 def sheet_names(path: Path) -> List[str]:
@@ -133,4 +251,4 @@ def sheet_names(path: Path) -> List[str]:
         return []
 
 
-__all__ = ["read_preview_frame", "sheet_names"]
+__all__ = ["excel_sheet_names", "read_excel", "read_preview_frame", "sheet_names"]
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import re
 from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
+_STRING_DTYPE = pd.StringDtype("pyarrow")
+
 
 def numeric_ratio(series: pd.Series) -> float:
     try:
@@ -25,104 +29,121 @@ def is_year_like(series: pd.Series) -> bool:
         return False
 
 
+def _col_profile(series: pd.Series) -> Tuple[float, bool]:
+    """Numeric ratio and year-likeness of ``series`` from a single ``to_numeric`` pass."""
+    try:
+        vals = pd.to_numeric(series, errors="coerce")
+        valid = vals.notna()
+        ratio = float(valid.mean()) if len(vals) else 0.0
+        year_like = bool(valid.any() and vals[valid].between(1900, 2100).mean() > 0.6)
+        return ratio, year_like
+    except Exception:
+        return 0.0, False
+
+
+def _profiles(df: pd.DataFrame) -> List[Tuple[float, bool]]:
+    return [_col_profile(df.iloc[:, idx]) for idx in range(df.shape[1])]
+
+
 def is_numeric_col(series: pd.Series) -> bool:
-    return numeric_ratio(series) > 0.6 and not is_year_like(series)
+    ratio, year_like = _col_profile(series)
+    return ratio > 0.6 and not year_like
+
+
+def _is_texty(series: pd.Series, ratio: float) -> bool:
+    if ratio >= 0.3 or series.empty:
+        return False
+    # Arrow-backed strings give a vectorized str.len(); nulls count as empty strings.
+    lengths = series.astype(_STRING_DTYPE).str.len().fillna(0)
+    return float(lengths.mean()) > 12
 
 
 def is_texty_col(series: pd.Series) -> bool:
-    return series.fillna("").astype(str).map(len).mean() > 12 and numeric_ratio(series) < 0.3
+    return _is_texty(series, numeric_ratio(series))
 
 
-def find_numeric_blocks(df: pd.DataFrame) -> List[Dict[str, object]]:
+def find_numeric_blocks(
+    df: pd.DataFrame, profiles: Sequence[Tuple[float, bool]] | None = None
+) -> List[Dict[str, object]]:
     """Identify contiguous numeric column blocks that are not year-like."""
-    numeric_flags: List[bool] = []
-    for col in df.columns:
-        series = df[col]
-        flag = is_numeric_col(series)
-        numeric_flags.append(flag)
-
-    blocks: List[List[int]] = []
-    current: List[int] = []
-    for idx, is_num in enumerate(numeric_flags):
-        if is_num:
-            current.append(idx)
-        else:
-            if current:
-                blocks.append(current)
-            current = []
-    if current:
-        blocks.append(current)
-
+    if profiles is None:
+        profiles = _profiles(df)
+    flags = np.fromiter(
+        (ratio > 0.6 and not year_like for ratio, year_like in profiles), dtype=np.int8, count=len(profiles)
+    )
+    # Rising/falling edges of the padded flag array delimit half-open runs of numeric columns.
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], flags, [0]))))
     results: List[Dict[str, object]] = []
-    for block in blocks:
-        cols = [df.columns[i] for i in block]
-        if not cols:
-            continue
+    for start, end in zip(edges[0::2].tolist(), edges[1::2].tolist()):
         results.append(
             {
-                "columns": cols,
-                "start_idx": block[0],
-                "end_idx": block[-1],
+                "columns": list(df.columns[start:end]),
+                "start_idx": start,
+                "end_idx": end - 1,
             }
         )
     return results
 
 
+_MONTH_ALIASES = {
+    "tammikuu": "jan",
+    "helmikuu": "feb",
+    "maaliskuu": "mar",
+    "huhtikuu": "apr",
+    "toukokuu": "may",
+    "kesäkuu": "jun",
+    "heinäkuu": "jul",
+    "elokuu": "aug",
+    "syyskuu": "sep",
+    "lokakuu": "oct",
+    "marraskuu": "nov",
+    "joulukuu": "dec",
+    "januaari": "jan",
+    "january": "jan",
+    "february": "feb",
+    "march": "mar",
+    "april": "apr",
+    "may": "may",
+    "june": "jun",
+    "july": "jul",
+    "august": "aug",
+    "september": "sep",
+    "october": "oct",
+    "november": "nov",
+    "december": "dec",
+    "januari": "jan",
+    "februari": "feb",
+    "mars": "mar",
+    "maj": "may",
+    "juni": "jun",
+    "juli": "jul",
+    "augusti": "aug",
+    "oktober": "oct",
+    "maerz": "mar",
+    "märz": "mar",
+    "mai": "may",
+    "dezember": "dec",
+}
+_MONTH_ABBR_RE = re.compile("jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec")
+_HEADER_SEPARATORS = str.maketrans("/-", "  ")
+
+
 def _normalize_month(token: str) -> str | None:
-    month_map = {
-        "tammikuu": "jan",
-        "helmikuu": "feb",
-        "maaliskuu": "mar",
-        "huhtikuu": "apr",
-        "toukokuu": "may",
-        "kesäkuu": "jun",
-        "heinäkuu": "jul",
-        "elokuu": "aug",
-        "syyskuu": "sep",
-        "lokakuu": "oct",
-        "marraskuu": "nov",
-        "joulukuu": "dec",
-        "januaari": "jan",
-        "january": "jan",
-        "february": "feb",
-        "march": "mar",
-        "april": "apr",
-        "may": "may",
-        "june": "jun",
-        "july": "jul",
-        "august": "aug",
-        "september": "sep",
-        "october": "oct",
-        "november": "nov",
-        "december": "dec",
-        "januari": "jan",
-        "februari": "feb",
-        "mars": "mar",
-        "maj": "may",
-        "juni": "jun",
-        "juli": "jul",
-        "augusti": "aug",
-        "oktober": "oct",
-        "maerz": "mar",
-        "märz": "mar",
-        "mai": "may",
-        "dezember": "dec",
-    }
     lower = token.lower()
-    if lower in month_map:
-        return month_map[lower]
-    for eng in ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]:
-        if eng in lower:
-            return eng
-    return None
+    alias = _MONTH_ALIASES.get(lower)
+    if alias is not None:
+        return alias
+    match = _MONTH_ABBR_RE.search(lower)
+    return match.group(0) if match else None
 
 
-def schema_diff(headers: Sequence[str], target_fields: Iterable[str] | None) -> Tuple[List[str], List[str]]:
-    current = set(target_fields or [])
+def _schema_diff(headers: Sequence[str], target_set: frozenset) -> Tuple[List[str], List[str]]:
     proposed = set(headers)
-    missing = sorted(list(current - proposed))
-    extra = sorted(list(proposed - current))
-    return missing, extra
+    return sorted(target_set - proposed), sorted(proposed - target_set)
+
+
+def schema_diff(headers: Sequence[str], target_fields: Iterable[str] | None) -> Tuple[List[str], List[str]]:
+    return _schema_diff(headers, frozenset(target_fields or ()))
 
 
 def build_schema_candidates(
@@ -139,15 +160,20 @@ def build_schema_candidates(
 
     add_candidate("As detected", list(headers), 0.20, "Headers as read from file.")
 
-    numeric_cols = [col for col in df.columns if is_numeric_col(df[col])]
-    text_cols = [col for col in df.columns if is_texty_col(df[col])]
+    profiles = _profiles(df)
+    numeric_cols = [
+        col for col, (ratio, year_like) in zip(df.columns, profiles) if ratio > 0.6 and not year_like
+    ]
+    text_cols = [
+        col for idx, (col, (ratio, _)) in enumerate(zip(df.columns, profiles)) if _is_texty(df.iloc[:, idx], ratio)
+    ]
 
     combined_headers: List[str] = []
     combined_changed = False
     for h in headers:
-        parts = str(h).replace("/", " ").replace("-", " ").split()
+        parts = str(h).translate(_HEADER_SEPARATORS).split()
         year = next((p for p in parts if p.isdigit() and len(p) == 4), None)
-        month = next((_normalize_month(p) for p in parts if _normalize_month(p)), None)
+        month = next(filter(None, map(_normalize_month, parts)), None)
         if year and month:
             combined_headers.append(f"{year}-{month}")
             combined_changed = True
@@ -157,7 +183,7 @@ def build_schema_candidates(
     if combined_changed:
         add_candidate("Combined year+month headers", combined_headers, 0.35, "Merged year + month tokens into single period labels.")
 
-    block_info = find_numeric_blocks(df)
+    block_info = find_numeric_blocks(df, profiles)
     for block in block_info:
         cols = block["columns"]
         start_idx = block["start_idx"]
@@ -214,10 +240,11 @@ def build_schema_candidates(
             continue
         filtered.append(cand)
 
+    target_set = frozenset(target_fields or ())
     annotated: List[Dict[str, object]] = []
     for cand in filtered:
         hdrs = [str(h) for h in cand.get("headers", [])]
-        missing, extra = schema_diff(hdrs, target_fields)
+        missing, extra = _schema_diff(hdrs, target_set)
         note = cand.get("note", "")
         if missing or extra:
             miss_txt = (
@@ -11,6 +11,7 @@ import importlib.util
 import json
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -60,9 +61,9 @@ def parse_skiprows(raw_value: str | None) -> List[int]:
 # --- Data Classes ---
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HeaderCell:
-    """Represents the position of a header cell along with its mapping."""
+    """Represents the position of a header cell along with its mapping (immutable, hashable)."""
 
     name: str
     column: int
@@ -95,7 +96,7 @@ class HeaderCell:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Template:
     """Unified representation of a template."""
 
@@ -371,6 +372,30 @@ def load_template(path: Path) -> Template:
     return Template.from_dict(payload)
 
 
+# Canonical HeaderCell instances shared by every cached template that uses them.
+_HEADER_POOL: Dict[HeaderCell, HeaderCell] = {}
+
+
+@lru_cache(maxsize=128)
+def _load_template_at(path_str: str, _mtime_ns: int) -> Template:
+    template = load_template(Path(path_str))
+    template.headers = [_HEADER_POOL.setdefault(cell, cell) for cell in template.headers]
+    return template
+
+
+def load_template_cached(path: Path) -> Template:
+    """Load a template, reusing the parsed instance while the file is unchanged.
+
+    The returned ``Template`` is shared between callers and must be treated as
+    read-only; use ``load_template`` when the result will be edited.
+    """
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        raise FileNotFoundError(f"Template not found: {path}") from None
+    return _load_template_at(str(path.resolve()), mtime_ns)
+
+
 def save_template(template: Template, path: Path) -> None:
     """Persist a template to disk using the path's extension."""
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -4,14 +4,34 @@ from __future__ import annotations
 
 import logging
 import os
-import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable, Iterator, List, Optional
 
+import numpy as np
 import pandas as pd
 import requests
 
 API_BASE = "https://www.googleapis.com/youtube/v3"
 DEFAULT_TIMEOUT = 30
+_MAX_PARALLEL_REQUESTS = 8
+
+# Shared keep-alive pool so repeated fetches reuse connections to googleapis.com;
+# sized to cover the parallel videos lookups.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=2 * _MAX_PARALLEL_REQUESTS),
+)
+
+# channel_id -> (expiry on the monotonic clock, uploads playlist id). The mapping is
+# effectively permanent, so the TTL only bounds staleness; the API key isn't part of the key.
+_UPLOADS_CACHE: dict[str, tuple[float, str]] = {}
+_UPLOADS_CACHE_MAX_ENTRIES = 256
+_UPLOADS_TTL_SECONDS = 3600
+_UPLOADS_LOCK = threading.Lock()
+
 OUTPUT_COLUMNS = [
     "video_id",
     "title",
@@ -33,6 +53,14 @@ DERIVED_COLUMNS = [
     "engagement_rate_pct",
 ]
 SUMMARY_SHEETS = ["detail", "top_videos", "per_channel", "per_year"]
+_COUNT_COLUMNS = ("view_count", "like_count", "comment_count")
+_THUMBNAIL_KEYS = ("standard", "high", "medium", "default")
+# Designator -> (position in the grammar, seconds per unit) for PnDTnHnMnS durations.
+_DURATION_DATE_UNITS = {"D": (0, 86400)}
+_DURATION_TIME_UNITS = {"H": (1, 3600), "M": (2, 60), "S": (3, 1)}
+# Same grammar for whole columns via Series.str.extract (days, hours, minutes, seconds).
+_ISO8601_DURATION_PATTERN = r"^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$"
+_DURATION_UNIT_SECONDS = np.array([86400, 3600, 60, 1], dtype=np.int64)
 
 
 class YouTubeAuthError(RuntimeError):
@@ -48,11 +76,13 @@ def _get_api_key(explicit: str | None = None) -> str:
     return api_key
 
 
-def _request(endpoint: str, params: dict, api_key: str) -> dict:
+def _request(
+    endpoint: str, params: dict, api_key: str, session: requests.Session | None = None
+) -> dict:
     payload = dict(params or {})
     payload["key"] = api_key
     url = f"{API_BASE}/{endpoint}"
-    resp = requests.get(url, params=payload, timeout=DEFAULT_TIMEOUT)
+    resp = (session or _SESSION).get(url, params=payload, timeout=DEFAULT_TIMEOUT)
     try:
         resp.raise_for_status()
     except requests.HTTPError as exc:  # pragma: no cover - passthrough detail
@@ -65,22 +95,34 @@ def _parse_iso8601_duration(duration: str | None) -> int:
     """
     Convert ISO-8601 duration (e.g., PT1H2M3S) to seconds.
     Returns 0 when parsing fails or duration is missing.
+    Scalar reference for ``_durations_to_seconds``, which the fetch path uses.
     """
-    if not duration:
-        return 0
-    pattern = re.compile(
-        r"P(?:(?P<days>\d+)D)?"
-        r"(?:T"
-        r"(?:(?P<hours>\d+)H)?"
-        r"(?:(?P<minutes>\d+)M)?"
-        r"(?:(?P<seconds>\d+)S)?"
-        r")?$"
-    )
-    match = pattern.match(duration)
-    if not match:
+    if not duration or duration[0] != "P":
         return 0
-    parts = {k: int(v) if v is not None else 0 for k, v in match.groupdict().items()}
-    return parts["seconds"] + parts["minutes"] * 60 + parts["hours"] * 3600 + parts["days"] * 86400
+    total = 0
+    number: int | None = None
+    position = -1
+    units = _DURATION_DATE_UNITS
+    for ch in duration[1:]:
+        if "0" <= ch <= "9":
+            number = (number or 0) * 10 + (ord(ch) - 48)
+        elif ch == "T" and units is _DURATION_DATE_UNITS and number is None:
+            units = _DURATION_TIME_UNITS
+        else:
+            unit = units.get(ch)
+            # Unknown designators, missing digits and out-of-order units are invalid.
+            if unit is None or number is None or unit[0] <= position:
+                return 0
+            position = unit[0]
+            total += number * unit[1]
+            number = None
+    return 0 if number is not None else total
+
+
+def _durations_to_seconds(durations: pd.Series) -> np.ndarray:
+    """Vectorized ``_parse_iso8601_duration`` over a Series of ISO-8601 strings."""
+    parts = durations.astype(object).str.extract(_ISO8601_DURATION_PATTERN)
+    return parts.astype("float64").fillna(0).to_numpy(dtype=np.int64) @ _DURATION_UNIT_SECONDS
 
 
 def _chunked(items: Iterable[str], size: int) -> Iterator[List[str]]:
@@ -94,54 +136,79 @@ def _chunked(items: Iterable[str], size: int) -> Iterator[List[str]]:
         yield bucket
 
 
-def _uploads_playlist_id(channel_id: str, api_key: str) -> str:
+def _uploads_playlist_id(channel_id: str, api_key: str, session: requests.Session | None = None) -> str:
+    now = time.monotonic()
+    with _UPLOADS_LOCK:
+        cached = _UPLOADS_CACHE.get(channel_id)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
     data = _request(
         "channels",
         {"part": "contentDetails", "id": channel_id, "maxResults": 1},
         api_key=api_key,
+        session=session,
     )
     items = data.get("items") or []
     if not items:
         raise ValueError(f"Channel '{channel_id}' not found.")
-    return items[0]["contentDetails"]["relatedPlaylists"]["uploads"]
-
-
-def _fetch_playlist_video_ids(playlist_id: str, max_results: int, api_key: str) -> list[str]:
+    uploads = items[0]["contentDetails"]["relatedPlaylists"]["uploads"]
+    with _UPLOADS_LOCK:
+        if len(_UPLOADS_CACHE) >= _UPLOADS_CACHE_MAX_ENTRIES:
+            for stale in [cid for cid, (expires, _) in _UPLOADS_CACHE.items() if expires <= now]:
+                del _UPLOADS_CACHE[stale]
+            if len(_UPLOADS_CACHE) >= _UPLOADS_CACHE_MAX_ENTRIES:
+                _UPLOADS_CACHE.pop(next(iter(_UPLOADS_CACHE)))
+        _UPLOADS_CACHE[channel_id] = (now + _UPLOADS_TTL_SECONDS, uploads)
+    return uploads
+
+
+def _fetch_playlist_video_ids(
+    playlist_id: str, max_results: int, api_key: str, session: requests.Session | None = None
+) -> list[str]:
     videos: list[str] = []
+    add_video = videos.append
+    count = 0
     page_token: Optional[str] = None
 
-    while True:
-        remaining = max_results - len(videos)
-        if remaining <= 0:
-            break
-
+    while count < max_results:
         data = _request(
             "playlistItems",
             {
                 "part": "contentDetails",
                 "playlistId": playlist_id,
-                "maxResults": min(50, remaining),
+                "maxResults": min(50, max_results - count),
                 "pageToken": page_token,
             },
             api_key=api_key,
+            session=session,
         )
         for item in data.get("items", []):
-            vid = item.get("contentDetails", {}).get("videoId")
+            try:
+                vid = item["contentDetails"]["videoId"]
+            except (KeyError, TypeError):
+                continue
             if vid:
-                videos.append(vid)
+                add_video(vid)
+                count += 1
+                if count >= max_results:
+                    break
 
         page_token = data.get("nextPageToken")
         if not page_token:
             break
 
-    return videos[:max_results]
+    return videos
 
 
 def _pick_thumbnail(snippet: dict) -> str | None:
-    thumbs = snippet.get("thumbnails") or {}
-    for key in ("standard", "high", "medium", "default"):
-        if key in thumbs and isinstance(thumbs[key], dict):
-            return thumbs[key].get("url")
+    thumbs = snippet.get("thumbnails")
+    if not thumbs:
+        return None
+    for key in _THUMBNAIL_KEYS:
+        thumb = thumbs.get(key)
+        if thumb:
+            return thumb.get("url")
     return None
 
 
@@ -170,9 +237,10 @@ def fetch_videos_dataframe(
     if not video_ids:
         return pd.DataFrame(columns=OUTPUT_COLUMNS)
 
-    records: list[dict] = []
-    for chunk in _chunked(video_ids, 50):
-        data = _request(
+    chunks = list(_chunked(video_ids, 50))
+
+    def fetch_chunk(chunk: List[str]) -> dict:
+        return _request(
             "videos",
             {
                 "part": "snippet,contentDetails,statistics",
@@ -181,29 +249,52 @@ def fetch_videos_dataframe(
             },
             api_key=key,
         )
+
+    # Chunk lookups are independent; map() keeps responses in playlist order.
+    with ThreadPoolExecutor(max_workers=min(_MAX_PARALLEL_REQUESTS, len(chunks))) as pool:
+        responses = list(pool.map(fetch_chunk, chunks))
+
+    # duration_seconds is derived from the duration column after construction.
+    columns: dict[str, list] = {col: [] for col in OUTPUT_COLUMNS if col != "duration_seconds"}
+    # Bound appenders, in column order, keep per-item work to local calls.
+    (
+        add_video_id,
+        add_title,
+        add_description,
+        add_channel_id,
+        add_channel_title,
+        add_published_at,
+        add_duration,
+        add_view_count,
+        add_like_count,
+        add_comment_count,
+        add_tags,
+        add_thumbnail_url,
+    ) = (values.append for values in columns.values())
+    for data in responses:
         for item in data.get("items", []):
             snippet = item.get("snippet", {}) or {}
             stats = item.get("statistics", {}) or {}
             content = item.get("contentDetails", {}) or {}
-            records.append(
-                {
-                    "video_id": item.get("id"),
-                    "title": snippet.get("title"),
-                    "description": snippet.get("description"),
-                    "channel_id": snippet.get("channelId"),
-                    "channel_title": snippet.get("channelTitle"),
-                    "published_at": snippet.get("publishedAt"),
-                    "duration": content.get("duration"),
-                    "duration_seconds": _parse_iso8601_duration(content.get("duration")),
-                    "view_count": int(stats.get("viewCount", 0) or 0),
-                    "like_count": int(stats.get("likeCount", 0) or 0),
-                    "comment_count": int(stats.get("commentCount", 0) or 0),
-                    "tags": ", ".join(snippet.get("tags", [])) if snippet.get("tags") else "",
-                    "thumbnail_url": _pick_thumbnail(snippet),
-                }
-            )
-
-    df = pd.DataFrame(records, columns=OUTPUT_COLUMNS)
+            tags = snippet.get("tags")
+            add_video_id(item.get("id"))
+            add_title(snippet.get("title"))
+            add_description(snippet.get("description"))
+            add_channel_id(snippet.get("channelId"))
+            add_channel_title(snippet.get("channelTitle"))
+            add_published_at(snippet.get("publishedAt"))
+            add_duration(content.get("duration"))
+            add_view_count(stats.get("viewCount"))
+            add_like_count(stats.get("likeCount"))
+            add_comment_count(stats.get("commentCount"))
+            add_tags(", ".join(tags) if tags else "")
+            add_thumbnail_url(_pick_thumbnail(snippet))
+
+    df = pd.DataFrame(columns, columns=OUTPUT_COLUMNS)
+    df["duration_seconds"] = _durations_to_seconds(df["duration"])
+    # The API returns counts as strings; convert each column in one vectorized pass.
+    for col in _COUNT_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype("int64")
     logging.info("Fetched %d videos from playlist %s", len(df), target_playlist)
     return df
 
@@ -212,20 +303,24 @@ def add_engagement_metrics(df: pd.DataFrame) -> pd.DataFrame:
     """Add engagement_rate metrics; avoids division by zero."""
     if df.empty:
         return df
-    base = df.copy()
-    likes = base["like_count"] if "like_count" in base else pd.Series(0, index=base.index)
-    comments = base["comment_count"] if "comment_count" in base else pd.Series(0, index=base.index)
-    views = base["view_count"] if "view_count" in base else pd.Series(0, index=base.index)
-    engagement = (likes.fillna(0) + comments.fillna(0)).astype(float)
-    denom = pd.to_numeric(views.replace({0: None}), errors="coerce")
-    rate = engagement.divide(denom).fillna(0.0)
-    base["engagement_rate"] = rate
-    base["engagement_rate_pct"] = (rate * 100).round(2)
-    return base
+
+    def column(name: str) -> np.ndarray:
+        if name not in df:
+            return np.zeros(len(df), dtype=np.float64)
+        return pd.to_numeric(df[name], errors="coerce").fillna(0).to_numpy(dtype=np.float64)
+
+    views = column("view_count")
+    engagement = column("like_count") + column("comment_count")
+    rate = np.zeros_like(views)
+    np.divide(engagement, views, out=rate, where=views > 0)
+    return df.assign(engagement_rate=rate, engagement_rate_pct=np.round(rate * 100, 2))
 
 
 def build_summaries(df: pd.DataFrame, top_n: int = 10) -> dict[str, pd.DataFrame]:
-    """Create summary DataFrames for reporting/demo."""
+    """Create summary DataFrames for reporting/demo.
+
+    The ``detail`` entry is ``df`` itself, not a copy.
+    """
     if df.empty:
         return {
             "detail": df,
@@ -236,12 +331,16 @@ def build_summaries(df: pd.DataFrame, top_n: int = 10) -> dict[str, pd.DataFrame
             "per_year": pd.DataFrame(columns=["year", "video_count", "views", "likes", "comments"]),
         }
 
-    detail = df.copy()
-    detail["published_dt"] = pd.to_datetime(detail["published_at"], errors="coerce")
-    top_videos = detail.sort_values(by=["view_count", "like_count"], ascending=False).head(top_n)
+    # ``df`` is only read: the publish timestamp stays a local Series rather than a
+    # temporary column, so no copy of the frame is needed.
+    # The API always returns RFC 3339 timestamps; naming the format skips per-call inference.
+    published_dt = pd.to_datetime(df["published_at"], format="ISO8601", errors="coerce")
+    top_videos = df.nlargest(top_n, ["view_count", "like_count"])
 
+    # Categorical keys let groupby accumulate on integer codes instead of hashing strings;
+    # the output column goes back to plain object so the summary schema is unchanged.
     per_channel = (
-        detail.groupby("channel_title", dropna=False)
+        df.groupby(df["channel_title"].astype("category"), dropna=False, observed=True)
         .agg(
             video_count=("video_id", "count"),
             views=("view_count", "sum"),
@@ -250,12 +349,12 @@ def build_summaries(df: pd.DataFrame, top_n: int = 10) -> dict[str, pd.DataFrame
             avg_engagement_pct=("engagement_rate_pct", "mean"),
         )
         .reset_index()
+        .astype({"channel_title": object})
         .sort_values(by="views", ascending=False)
     )
 
     per_year = (
-        detail.assign(year=detail["published_dt"].dt.year)
-        .groupby("year", dropna=False)
+        df.groupby(published_dt.dt.year.astype("Int16").rename("year"), dropna=False)
         .agg(
             video_count=("video_id", "count"),
             views=("view_count", "sum"),
@@ -267,8 +366,8 @@ def build_summaries(df: pd.DataFrame, top_n: int = 10) -> dict[str, pd.DataFrame
     )
 
     return {
-        "detail": detail.drop(columns=["published_dt"]),
-        "top_videos": top_videos.drop(columns=["published_dt"]),
+        "detail": df,
+        "top_videos": top_videos,
         "per_channel": per_channel,
         "per_year": per_year,
     }
@@ -0,0 +1,32 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+
+def _peek_rows(path: Path, sheet: str, n: int = 12) -> pd.DataFrame:
+    """First ``n`` raw rows of ``sheet`` (like ``read_excel(header=None, nrows=n)``)."""
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = list(workbook[sheet].iter_rows(max_row=n, values_only=True))
+    finally:
+        workbook.close()
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preview_cache_dir(tmp_path_factory):
+    """Keep the on-disk preview cache inside a temporary directory for the whole suite."""
+    import src.services.io as io_mod
+
+    cache_dir = str(tmp_path_factory.mktemp("preview-cache"))
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DF_PREVIEW_CACHE_DIR", cache_dir)
+        mp.setattr(io_mod, "_PREVIEW_CACHE_DIR", cache_dir)
+        yield cache_dir
+
+
+@pytest.fixture
+def peek_rows():
+    return _peek_rows
@@ -0,0 +1,140 @@
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.combine_runner import concat_to_parquet, read_columns, run_combine
+
+
+def test_read_columns_matches_frame_headers(tmp_path: Path):
+    df = pd.DataFrame({"order_id": [1, 2], "amount": [3.5, 4.5]})
+    xlsx_path = tmp_path / "a.xlsx"
+    parquet_path = tmp_path / "a.parquet"
+    df.to_excel(xlsx_path, index=False)
+    df.to_parquet(parquet_path, index=False)
+
+    assert read_columns(xlsx_path) == ["order_id", "amount"]
+    assert read_columns(parquet_path) == ["order_id", "amount"]
+
+
+def test_run_combine_concat_and_merge(tmp_path: Path):
+    pd.DataFrame({"order_id": [1, 2], "amount": [10, 20]}).to_excel(tmp_path / "a.xlsx", index=False)
+    pd.DataFrame({"order_id": [2, 3], "qty": [5, 6]}).to_excel(tmp_path / "b.xlsx", index=False)
+
+    stacked = run_combine(tmp_path, pattern="*.xlsx", mode="concat")
+    assert len(stacked) == 4
+
+    merged = run_combine(tmp_path, pattern="*.xlsx", mode="merge", keys=["order_id"], how="inner")
+    assert merged["order_id"].tolist() == [2]
+    assert merged["amount"].tolist() == [20]
+    assert merged["qty"].tolist() == [5]
+
+
+def test_concat_parquet_inputs_unions_columns(tmp_path: Path):
+    pd.DataFrame({"order_id": [1, 2], "amount": [1.5, 2.5]}).to_parquet(tmp_path / "a.parquet", index=False)
+    pd.DataFrame({"order_id": [3], "region": ["north"]}).to_parquet(tmp_path / "b.parquet", index=False)
+
+    combined = run_combine(tmp_path, pattern="*.parquet", mode="concat")
+    assert list(combined.columns) == ["order_id", "amount", "region"]
+    assert combined["order_id"].tolist() == [1, 2, 3]
+    assert list(combined.index) == [0, 1, 2]
+
+
+def test_strict_schema_reports_column_diff(tmp_path: Path):
+    pd.DataFrame({"order_id": [1], "amount": [1.0]}).to_parquet(tmp_path / "a.parquet", index=False)
+    pd.DataFrame({"order_id": [2], "qty": [3]}).to_parquet(tmp_path / "b.parquet", index=False)
+
+    with pytest.raises(ValueError, match=r"b\.parquet: missing \['amount'\], extra \['qty'\]"):
+        run_combine(tmp_path, pattern="*.parquet", mode="concat", strict_schema=True)
+
+
+def test_multi_way_merge_matches_pairwise_fold(tmp_path: Path):
+    a = pd.DataFrame({"order_id": [3, 1, 2], "amount": [30, 10, 20]})
+    b = pd.DataFrame({"order_id": [1, 2, 4], "qty": [1, 2, 4]})
+    c = pd.DataFrame({"order_id": [2, 1], "region": ["s", "n"]})
+    for name, df in {"a": a, "b": b, "c": c}.items():
+        df.to_parquet(tmp_path / f"{name}.parquet", index=False)
+
+    for how in ("inner", "left", "outer"):
+        expected = a.merge(b, on="order_id", how=how).merge(c, on="order_id", how=how)
+        result = run_combine(tmp_path, pattern="*.parquet", mode="merge", keys=["order_id"], how=how)
+        pd.testing.assert_frame_equal(result.reset_index(drop=True), expected.reset_index(drop=True))
+
+
+def test_multi_way_merge_rejects_mismatched_key_types(tmp_path: Path):
+    pd.DataFrame({"id": [1, 2], "a": [10, 20]}).to_parquet(tmp_path / "a.parquet", index=False)
+    pd.DataFrame({"id": [1, 2], "b": [3, 4]}).to_parquet(tmp_path / "b.parquet", index=False)
+    pd.DataFrame({"id": ["1", "2"], "c": [5, 6]}).to_parquet(tmp_path / "c.parquet", index=False)
+
+    for how in ("inner", "left"):
+        with pytest.raises(ValueError, match="merge on"):
+            run_combine(tmp_path, pattern="*.parquet", mode="merge", keys=["id"], how=how)
+
+
+def test_concat_to_parquet_streams_matching_inputs(tmp_path: Path):
+    files = []
+    for idx in range(3):
+        path = tmp_path / f"part{idx}.parquet"
+        pd.DataFrame({"order_id": [idx * 10, idx * 10 + 1], "amount": [1.0, 2.0]}).to_parquet(path, index=False)
+        files.append(path)
+    out_path = tmp_path / "out" / "combined.parquet"
+
+    rows = concat_to_parquet(files, out_path, strict_schema=True)
+
+    assert rows == 6
+    combined = pd.read_parquet(out_path)
+    assert combined["order_id"].tolist() == [0, 1, 10, 11, 20, 21]
+
+
+def test_concat_to_parquet_widens_ints_to_floats(tmp_path: Path):
+    files = [tmp_path / "a.parquet", tmp_path / "b.parquet"]
+    pd.DataFrame({"amount": [1.0, 2.0]}).to_parquet(files[0], index=False)
+    pd.DataFrame({"amount": [3, 4]}).to_parquet(files[1], index=False)
+    out_path = tmp_path / "combined.parquet"
+
+    assert concat_to_parquet(files, out_path, strict_schema=False) == 4
+    assert pd.read_parquet(out_path)["amount"].tolist() == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_concat_to_parquet_does_not_cast_strings_to_numbers(tmp_path: Path):
+    from src.combine_runner import concat_frames
+
+    files = [tmp_path / "a.parquet", tmp_path / "b.parquet"]
+    pd.DataFrame({"code": [1.5, 2.5]}).to_parquet(files[0], index=False)
+    pd.DataFrame({"code": ["007", "010"]}).to_parquet(files[1], index=False)
+
+    assert concat_frames(files, strict_schema=False)["code"].tolist() == [1.5, 2.5, "007", "010"]
+    # Streaming used to cast "007"/"010" to 7.0/10.0; the in-memory concat keeps the strings,
+    # which a single parquet column cannot hold.
+    with pytest.raises(pa.ArrowException):
+        concat_to_parquet(files, tmp_path / "combined.parquet", strict_schema=False)
+
+
+def test_merge_reports_files_missing_keys_before_reading(tmp_path: Path):
+    pd.DataFrame({"order_id": [1], "amount": [1.0]}).to_parquet(tmp_path / "a.parquet", index=False)
+    pd.DataFrame({"sku": [1], "qty": [3]}).to_parquet(tmp_path / "b.parquet", index=False)
+
+    with pytest.raises(ValueError, match=r"b\.parquet \(missing: order_id\)"):
+        run_combine(tmp_path, pattern="*.parquet", mode="merge", keys=["order_id"])
+
+
+def test_join_frames_names_files_missing_keys():
+    from src.combine_runner import join_frames
+
+    frames = [pd.DataFrame({"order_id": [1], "amount": [1.0]}), pd.DataFrame({"sku": [1]})]
+    files = [Path("a.parquet"), Path("b.parquet")]
+
+    with pytest.raises(ValueError, match=r"b\.parquet \(missing: order_id\)"):
+        join_frames(frames, keys=["order_id"], how="inner", files=files)
+
+
+def test_check_schema_headers_reads_parquet_footers(tmp_path: Path):
+    from src.combine_runner import check_schema_headers
+
+    pd.DataFrame({"order_id": [1], "amount": [1.0]}).to_parquet(tmp_path / "a.parquet", index=False)
+    pd.DataFrame({"order_id": [2], "qty": [3]}).to_parquet(tmp_path / "b.parquet", index=False)
+
+    check_schema_headers([tmp_path / "a.parquet", tmp_path / "a.parquet"])
+    with pytest.raises(ValueError, match=r"b\.parquet: missing \['amount'\], extra \['qty'\]"):
+        check_schema_headers([tmp_path / "a.parquet", tmp_path / "b.parquet"])
@@ -36,3 +36,43 @@ def test_exporter_handles_parquet_and_nulls(tmp_path: Path):
     # null pct should be present and numeric
     assert "count" in manifest["metrics"]["null_pct"]
     assert isinstance(manifest["metrics"]["null_pct"]["count"], (int, float))
+
+
+def test_exporter_jsonl_rows_are_valid_json(tmp_path: Path):
+    df = pd.DataFrame({"count": [1.0, None], "label": ["ä", "b"]})
+    export_dataset(df, tmp_path, formats=["jsonl"], meta={})
+    lines = (tmp_path / "data.jsonl").read_text(encoding="utf-8").splitlines()
+    rows = [json.loads(line) for line in lines]
+    assert rows == [{"count": 1.0, "label": "ä"}, {"count": None, "label": "b"}]
+
+
+def test_exporter_defaults_to_parquet_and_feather(tmp_path: Path):
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}, index=[5, 7])
+    paths = export_dataset(df, tmp_path, meta={})
+    assert set(paths) == {"parquet", "feather", "manifest"}
+    assert not (tmp_path / "data.xlsx").exists()
+    assert pd.read_feather(paths["feather"]).equals(df.reset_index(drop=True))
+
+
+def test_exporter_xlsx_autofilter_covers_wide_frames(tmp_path: Path):
+    from openpyxl import load_workbook
+
+    df = pd.DataFrame([list(range(30))], columns=[f"c{i}" for i in range(30)])
+    export_dataset(df, tmp_path, formats=["xlsx"], meta={})
+
+    wb = load_workbook(tmp_path / "data.xlsx")
+    assert wb["data"].auto_filter.ref == "A1:AD2"
+
+
+def test_exporter_writes_gzipped_jsonl_in_chunks(tmp_path: Path, monkeypatch):
+    import gzip
+
+    import src.exporter as exporter
+
+    monkeypatch.setattr(exporter, "_JSONL_CHUNK_ROWS", 2)
+    df = pd.DataFrame({"n": [1, 2, 3, 4, 5]})
+    paths = export_dataset(df, tmp_path, formats=["jsonl_gz"], meta={})
+
+    with gzip.open(paths["jsonl_gz"], "rt", encoding="utf-8") as fh:
+        rows = [json.loads(line) for line in fh]
+    assert rows == [{"n": n} for n in range(1, 6)]
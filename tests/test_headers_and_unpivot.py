@@ -6,9 +6,9 @@ from src.pipeline import transform, warn_on_schema_diff
 from src.templates import Template, normalize_excel_headers
 
 
-def test_merged_header_normalization():
+def test_merged_header_normalization(peek_rows):
     sample = Path("samples/merged_header.xlsx")
-    preview = pd.read_excel(sample, sheet_name="Sales", header=None, nrows=12)
+    preview = peek_rows(sample, "Sales")
     guessed = 0
     # emulate harness guess
     for idx, (_, row) in enumerate(preview.iterrows()):
@@ -24,3 +24,39 @@ def test_mislabeled_csv_with_xlsx_extension(tmp_path: Path):
     )
     assert list(preview.columns) == ["a", "b"]
     assert len(preview) == 2
+
+
+def test_sheet_names_and_preview_on_real_workbook(tmp_path: Path):
+    book = tmp_path / "book.xlsx"
+    with pd.ExcelWriter(book) as writer:
+        pd.DataFrame({"a": [1, 2, 3]}).to_excel(writer, sheet_name="First", index=False)
+        pd.DataFrame({"b": ["x"]}).to_excel(writer, sheet_name="Second", index=False)
+
+    assert sheet_names(book) == ["First", "Second"]
+
+    preview = read_preview_frame(
+        path=book,
+        source_type="excel",
+        sheet="Second",
+        header_row=0,
+        skiprows=[],
+        nrows=5,
+    )
+    assert preview["b"].tolist() == ["x"]
+
+
+def test_bounded_previews_persist_to_disk(tmp_path: Path, monkeypatch):
+    import src.services.io as io_mod
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(io_mod, "_PREVIEW_CACHE_DIR", str(cache_dir))
+    source = tmp_path / "data.csv"
+    pd.DataFrame({"a": [1, 2, 3]}).to_csv(source, index=False)
+
+    first = read_preview_frame(source, "csv", None, 0, [], nrows=2)
+    io_mod._cached_csv_preview.cache_clear()
+    second = read_preview_frame(source, "csv", None, 0, [], nrows=2)
+
+    assert len(list(cache_dir.glob("*.parquet"))) == 1
+    pd.testing.assert_frame_equal(first, second)
+
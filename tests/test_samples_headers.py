@@ -1,6 +1,5 @@
 from pathlib import Path
 
-import pandas as pd
 import pytest
 
 from src.core import guess_header_row
@@ -18,7 +17,7 @@ def load_expected():
 
 
 @pytest.mark.parametrize("key,meta", load_expected().items())
-def test_sample_headers(key, meta):
+def test_sample_headers(key, meta, peek_rows):
     fname, sheet = key.split("::", 1)
     path = SAMPLES_DIR / fname
     if not path.exists():
@@ -27,7 +26,7 @@ def test_sample_headers(key, meta):
     expected_headers = [str(h) for h in meta.get("expected_headers", [])]
     expected_header_row = meta.get("expected_header_row")
 
-    preview = pd.read_excel(path, sheet_name=sheet, header=None, nrows=12)
+    preview = peek_rows(path, sheet)
     guessed = guess_header_row(preview)
     normalized, _merged = normalize_excel_headers(
         path=path, sheet=sheet, header_row=guessed, skiprows=None
@@ -0,0 +1,47 @@
+import pandas as pd
+
+from src.services.schema_candidates import build_schema_candidates, find_numeric_blocks
+
+
+def test_find_numeric_blocks_skips_year_and_text_columns():
+    df = pd.DataFrame(
+        {
+            "product": ["alpha widget deluxe", "beta widget deluxe"],
+            "q1": [1.0, 2.0],
+            "q2": [3, 4],
+            "year": [2023, 2024],
+            "amount": [10.5, 11.5],
+        }
+    )
+
+    blocks = find_numeric_blocks(df)
+
+    assert [block["columns"] for block in blocks] == [["q1", "q2"], ["amount"]]
+    assert blocks[0]["start_idx"] == 1
+
+
+def test_build_schema_candidates_uses_text_key_for_numeric_block():
+    df = pd.DataFrame(
+        {
+            "description": ["a fairly long product name", "another long product name"],
+            "jan": [1, 2],
+            "feb": [3, 4],
+        }
+    )
+
+    candidates = build_schema_candidates(df, list(df.columns), target_fields=["description", "jan"])
+
+    block = next(c for c in candidates if c["label"] == "Numeric block ordering")
+    assert block["headers"] == ["description", "jan", "feb"]
+    assert "key column 'description'" in block["note"]
+    assert block["extra"] == ["feb"]
+
+
+def test_build_schema_candidates_combines_year_and_month_tokens():
+    headers = ["Product", "2024/tammikuu", "2024-Feb", "Email"]
+    df = pd.DataFrame([["x", 1, 2, "a@b.c"]], columns=headers)
+
+    candidates = build_schema_candidates(df, headers)
+
+    combined = next(c for c in candidates if c["label"] == "Combined year+month headers")
+    assert combined["headers"] == ["Product", "2024-jan", "2024-feb", "Email"]
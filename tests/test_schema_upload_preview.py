@@ -0,0 +1,38 @@
+import importlib.util
+import io
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+PAGE = Path(__file__).resolve().parents[1] / "webapp" / "pages" / "01_Schema_Upload.py"
+
+
+@pytest.fixture(scope="module")
+def schema_upload():
+    spec = importlib.util.spec_from_file_location(PAGE.stem, PAGE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize(
+    ("data", "header_row", "skiprows"),
+    [
+        (b"\n\na,b\n1,2\n3,4\n", 1, []),
+        (b"Report\n\na,b\n1,2\n", 2, []),
+        (b"Report\na,b\n1,2\n3,4\n", 0, [0]),
+        (b"a,b,c\n1,,x\n2,3,\n", 0, []),
+    ],
+)
+def test_csv_preview_matches_read_csv(schema_upload, data, header_row, skiprows):
+    preview = schema_upload._read_dataframe(
+        data, data.hex(), "upload.csv", header_row, skiprows, ",", "utf-8", None, 10
+    )
+    expected = pd.read_csv(io.BytesIO(data), header=header_row, skiprows=skiprows, nrows=10)
+
+    pd.testing.assert_frame_equal(preview, expected)
+
+
+def test_arrow_preview_skips_inputs_with_blank_lines(schema_upload):
+    assert schema_upload._read_csv_preview_arrow(b"\n\na,b\n1,2\n", 1, [], ",", "utf-8", 10) is None
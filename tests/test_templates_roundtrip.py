@@ -31,3 +31,37 @@ def test_template_roundtrip(tmp_path: Path):
     assert loaded.field_types == template.field_types
     assert loaded.var_name == "period"
     assert loaded.value_name == "amount"
+
+
+def test_load_template_cached_reloads_after_edit(tmp_path: Path):
+    import os
+
+    from src.templates import load_template_cached
+
+    path = tmp_path / "sample.df-template.json"
+    path.write_text(json.dumps(Template(sheet="Sheet1", header_row=1).to_dict()), encoding="utf-8")
+
+    first = load_template_cached(path)
+    assert load_template_cached(path) is first
+
+    path.write_text(json.dumps(Template(sheet="Sheet2", header_row=4).to_dict()), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reloaded = load_template_cached(path)
+    assert reloaded is not first
+    assert reloaded.sheet == "Sheet2"
+
+
+def test_cached_templates_share_header_cells(tmp_path: Path):
+    from src.templates import HeaderCell, load_template_cached
+
+    headers = [HeaderCell(name="Sku", column=0, row=0, alias="article_sku")]
+    first_path = tmp_path / "a.df-template.json"
+    second_path = tmp_path / "b.df-template.json"
+    for path in (first_path, second_path):
+        path.write_text(json.dumps(Template(sheet="Sheet1", headers=headers).to_dict()), encoding="utf-8")
+
+    first = load_template_cached(first_path)
+    second = load_template_cached(second_path)
+    assert first is not second
+    assert first.headers[0] is second.headers[0]
@@ -56,3 +56,31 @@ def test_build_summaries_shapes():
         "comments",
         "avg_engagement_pct",
     }
+    assert summaries["per_channel"]["channel_title"].dtype == object
+
+
+def test_uploads_playlist_id_is_cached_per_channel(monkeypatch):
+    import src.youtube as yt
+
+    calls = []
+
+    def fake_request(endpoint, params, api_key, session=None):
+        calls.append((endpoint, params["id"]))
+        return {"items": [{"contentDetails": {"relatedPlaylists": {"uploads": "UU" + params["id"]}}}]}
+
+    monkeypatch.setattr(yt, "_request", fake_request)
+    monkeypatch.setattr(yt, "_UPLOADS_CACHE", {})
+
+    assert yt._uploads_playlist_id("abc", "key-1") == "UUabc"
+    assert yt._uploads_playlist_id("abc", "key-2") == "UUabc"
+    assert calls == [("channels", "abc")]
+
+
+def test_vectorized_durations_match_scalar_parser():
+    import pandas as pd
+
+    from src.youtube import _durations_to_seconds
+
+    samples = ["PT1H2M3S", "PT5M", "P1DT1H", "PT0S", None, "", "not-a-duration", "XPT1S"]
+    result = _durations_to_seconds(pd.Series(samples, dtype=object))
+    assert result.tolist() == [_parse_iso8601_duration(s) for s in samples]
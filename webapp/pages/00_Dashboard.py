@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import fnmatch
+import os
 import subprocess
 import sys
 from datetime import datetime
@@ -11,22 +13,25 @@ from src.api.v1.engine import DataEngine
 from src.templates import load_template, locate_template
 
 
-def _latest_mtime(paths: list[Path]) -> float | None:
-    if not paths:
-        return None
-    return max(paths, key=lambda p: p.stat().st_mtime).stat().st_mtime
-
-
 def _format_time(timestamp: float | None) -> str:
     if timestamp is None:
         return "Never"
     return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
 
 
-def _scan_files(directory: Path, pattern: str = "*") -> list[Path]:
+def _scan_files(directory: Path, pattern: str = "*") -> list[tuple[Path, float]]:
+    """Return ``(path, mtime)`` pairs, newest first, with one stat per entry."""
     if not directory.exists():
         return []
-    return sorted(directory.glob(pattern), key=lambda p: p.stat().st_mtime, reverse=True)
+    include_hidden = pattern.startswith(".")
+    with os.scandir(directory) as it:
+        entries = [
+            (Path(entry.path), entry.stat().st_mtime)
+            for entry in it
+            if (include_hidden or not entry.name.startswith(".")) and fnmatch.fnmatch(entry.name, pattern)
+        ]
+    entries.sort(key=lambda item: item[1], reverse=True)
+    return entries
 
 
 def _run_batch() -> tuple[bool, str]:
@@ -45,8 +50,8 @@ def render() -> None:
     archive_files = _scan_files(Path("data/archive"))
     quarantine_files = _scan_files(Path("data/quarantine"))
 
-    last_output = _latest_mtime(output_files)
-    last_archive = _latest_mtime(archive_files)
+    last_output = output_files[0][1] if output_files else None
+    last_archive = archive_files[0][1] if archive_files else None
 
     metrics = st.columns(3)
     metrics[0].metric("Last Output Update", _format_time(last_output))
@@ -75,7 +80,7 @@ def render() -> None:
         return
 
     engine = DataEngine()
-    for path in quarantine_files[:3]:
+    for path, _mtime in quarantine_files[:3]:
         row = st.columns([3, 1])
         row[0].write(path.name)
         if row[1].button("Retry", key=f"retry_{path.name}"):
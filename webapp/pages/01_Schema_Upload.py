@@ -3,15 +3,19 @@ from __future__ import annotations
 import io
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import streamlit as st
 
 from src.core.state import SessionState
+from src.core.streamlit_io import content_digest
 from src.templates import parse_skiprows
 
 
 DEFAULTS = {
     "uploaded_name": None,
     "uploaded_bytes": None,
+    "uploaded_hash": None,
     "header_row": 0,
     "skiprows": "",
     "delimiter": ",",
@@ -20,15 +24,17 @@ DEFAULTS = {
 }
 
 
+# ``_data`` is skipped by Streamlit's cache hashing; the upload digest keys the cache instead.
 @st.cache_data(show_spinner=False)
-def _list_excel_sheets(data: bytes) -> list[str]:
-    with pd.ExcelFile(io.BytesIO(data)) as xf:
+def _list_excel_sheets(_data: bytes, digest: str) -> list[str]:
+    with pd.ExcelFile(io.BytesIO(_data)) as xf:
         return list(xf.sheet_names)
 
 
 @st.cache_data(show_spinner=False)
 def _read_dataframe(
-    data: bytes,
+    _data: bytes,
+    digest: str,
     filename: str,
     header_row: int,
     skiprows: list[int],
@@ -39,14 +45,17 @@ def _read_dataframe(
 ) -> pd.DataFrame:
     if filename.lower().endswith((".xlsx", ".xls")):
         return pd.read_excel(
-            io.BytesIO(data),
+            io.BytesIO(_data),
             sheet_name=sheet_name or 0,
             header=header_row,
             skiprows=skiprows,
             nrows=nrows,
         )
+    preview = _read_csv_preview_arrow(_data, header_row, skiprows, delimiter, encoding, nrows)
+    if preview is not None:
+        return preview
     return pd.read_csv(
-        io.BytesIO(data),
+        io.BytesIO(_data),
         header=header_row,
         skiprows=skiprows,
         sep=delimiter,
@@ -55,6 +64,48 @@ def _read_dataframe(
     )
 
 
+def _read_csv_preview_arrow(
+    data: bytes, header_row: int, skiprows: list[int], delimiter: str, encoding: str, nrows: int
+) -> pd.DataFrame | None:
+    """Stream the first ``nrows`` rows with Arrow's CSV reader.
+
+    Returns None when pandas semantics can't be reproduced (non-prefix skiprows,
+    multi-character separators, blank lines before or at the header, blank/duplicate
+    header names) or Arrow can't parse the input, so the caller falls back to
+    ``pd.read_csv``.
+    """
+    if len(delimiter) != 1 or sorted(skiprows) != list(range(len(skiprows))):
+        return None
+    skip_rows = len(skiprows) + header_row
+    try:
+        # pandas' ``header=N`` skips blank lines while Arrow's ``skip_rows`` counts them.
+        text = io.TextIOWrapper(io.BytesIO(data), encoding=encoding, errors="replace")
+        if any(not text.readline().strip() for _ in range(skip_rows + 1)):
+            return None
+        reader = pacsv.open_csv(
+            io.BytesIO(data),
+            read_options=pacsv.ReadOptions(skip_rows=skip_rows, encoding=encoding),
+            parse_options=pacsv.ParseOptions(delimiter=delimiter),
+            convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+        )
+        names = reader.schema.names
+        if "" in names or len(set(names)) != len(names):
+            return None
+        batches = []
+        rows = 0
+        while rows < nrows:
+            try:
+                batch = reader.read_next_batch()
+            except StopIteration:
+                break
+            batches.append(batch)
+            rows += batch.num_rows
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+    except (pa.ArrowInvalid, LookupError):
+        return None
+    return table.slice(0, nrows).to_pandas()
+
+
 def render() -> None:
     state = SessionState(DEFAULTS)
 
@@ -73,6 +124,7 @@ def render() -> None:
     if uploaded.name != state.uploaded_name:
         state.uploaded_name = uploaded.name
         state.uploaded_bytes = uploaded.getvalue()
+        state.uploaded_hash = content_digest(state.uploaded_bytes)
         state.sheet_name = None
 
     if not state.uploaded_bytes:
@@ -99,7 +151,7 @@ def render() -> None:
         state.skiprows = skiprows_text
 
         if is_excel:
-            sheets = _list_excel_sheets(state.uploaded_bytes)
+            sheets = _list_excel_sheets(state.uploaded_bytes, state.uploaded_hash)
             if not sheets:
                 sheets = ["Sheet1"]
             if state.sheet_name not in sheets:
@@ -118,6 +170,7 @@ def render() -> None:
             skiprows = parse_skiprows(state.skiprows)
             df = _read_dataframe(
                 state.uploaded_bytes,
+                state.uploaded_hash,
                 state.uploaded_name,
                 int(state.header_row),
                 skiprows,
@@ -1,29 +1,51 @@
 from __future__ import annotations
 
+import pandas as pd
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
 
 from src.core.state import SessionState
-from src.core.streamlit_io import list_excel_sheets, read_uploaded_dataframe
+from src.core.streamlit_io import content_digest, list_excel_sheets, read_uploaded_dataframe
 from src.templates import parse_skiprows
 
 
 DEFAULTS = {
     "uploaded_name": None,
     "uploaded_bytes": None,
+    "uploaded_hash": None,
     "header_row": 0,
     "skiprows": "",
     "delimiter": ",",
     "encoding": "utf-8",
     "sheet_name": None,
+    "upload_sheets": (None, []),
     "selected_column": None,
     "mappings": {},
     "metadata_cells": [],
+    "metadata_cells_df": pd.DataFrame(),
+    "meta_raw": (None, None),
     "meta_row_idx": None,
     "meta_col_idx": None,
     "meta_target": "",
     "meta_type": "metadata",
 }
 
+# Fragments rerun only their own block on widget events, so selecting cells or
+# typing metadata doesn't re-run the upload, sheet listing, and previews above.
+# st.fragment needs Streamlit 1.37 (1.33 as experimental); older versions rerun fully.
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (
+    lambda func: func
+)
+
+
+def _rerun_fragment() -> None:
+    """Rerun just the calling fragment so it redraws with the state it changed."""
+    try:
+        st.rerun(scope="fragment")
+    except (TypeError, StreamlitAPIException):
+        # Streamlit without fragment-scoped reruns (or no fragment support at all).
+        st.rerun()
+
 
 def _render_dataframe_selection(df):
     selection = None
@@ -52,6 +74,124 @@ def _extract_selected_column(selection) -> str | None:
     return None
 
 
+@_fragment
+def _preview_fragment(df, state: SessionState) -> None:
+    selection = _render_dataframe_selection(df)
+    selected = _extract_selected_column(selection)
+
+    if selected:
+        state.selected_column = selected
+    elif state.selected_column not in df.columns:
+        state.selected_column = None
+
+    if state.selected_column:
+        st.success(f"Selected column: {state.selected_column}")
+    else:
+        fallback = st.selectbox(
+            "Select a column to map",
+            options=["(none)"] + list(df.columns),
+        )
+        state.selected_column = None if fallback == "(none)" else fallback
+
+
+@_fragment
+def _metadata_fragment(raw_df, state: SessionState) -> None:
+    selected_row_idx = None
+    selected_col_idx = None
+    try:
+        # Relabel without copying the cell data; raw_df itself is left untouched.
+        display_df = raw_df.set_axis(
+            [f"Col {idx}" for idx in range(raw_df.shape[1])], axis=1, copy=False
+        )
+        meta_event = st.dataframe(
+            display_df,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode=["single-row", "single-column"],
+            height=240,
+        )
+        if meta_event.selection.rows:
+            selected_row_idx = int(meta_event.selection.rows[0])
+        if meta_event.selection.columns:
+            col_name = meta_event.selection.columns[0]
+            # Labels are "Col <position>", so the position can be read back directly.
+            if col_name.startswith("Col ") and col_name[4:].isdigit():
+                selected_col_idx = int(col_name[4:])
+    except TypeError:
+        st.caption("Selection API not available; using dropdowns.")
+        selected_row_idx = st.selectbox(
+            "Row", options=list(range(len(raw_df))), index=0 if len(raw_df) else 0
+        )
+        selected_col_idx = st.selectbox(
+            "Column",
+            options=list(range(len(raw_df.columns))),
+            format_func=lambda idx: f"Col {idx}",
+            index=0 if len(raw_df.columns) else 0,
+        )
+
+    cell_value = None
+    if selected_row_idx is not None and selected_col_idx is not None:
+        state.meta_row_idx = selected_row_idx
+        state.meta_col_idx = selected_col_idx
+        col_name = f"Col {selected_col_idx}"
+        cell_value = raw_df.iat[selected_row_idx, selected_col_idx]
+        st.write(
+            f"Selected cell: Row {selected_row_idx}, Column {col_name} -> `{cell_value}`"
+        )
+    else:
+        st.info("Select a row and column to capture metadata.")
+
+    state.meta_target = st.text_input(
+        "Metadata target name", value=state.meta_target
+    )
+    state.meta_type = st.selectbox(
+        "Metadata type",
+        options=["metadata", "title", "date", "header_def"],
+        index=["metadata", "title", "date", "header_def"].index(state.meta_type),
+    )
+
+    if cell_value is None and state.meta_row_idx is not None and state.meta_col_idx is not None:
+        try:
+            cell_value = raw_df.iat[int(state.meta_row_idx), int(state.meta_col_idx)]
+        except Exception:
+            cell_value = None
+
+    add_disabled = (
+        state.meta_row_idx is None
+        or state.meta_col_idx is None
+        or not state.meta_target.strip()
+    )
+    if st.button("Add Metadata Field", disabled=add_disabled):
+        entry = {
+            "row": int(state.meta_row_idx),
+            "col": int(state.meta_col_idx),
+            "value": "" if cell_value is None else str(cell_value),
+            "target": state.meta_target.strip(),
+            "metadata_type": state.meta_type,
+        }
+        state.metadata_cells = state.metadata_cells + [entry]
+        new_row = pd.DataFrame([entry])
+        cells_df = state.metadata_cells_df
+        state.metadata_cells_df = (
+            new_row if cells_df.empty else pd.concat([cells_df, new_row], ignore_index=True)
+        )
+        state.meta_target = ""
+        st.toast("Metadata field added.") if hasattr(st, "toast") else st.success(
+            "Metadata field added."
+        )
+        _rerun_fragment()
+
+    if state.metadata_cells:
+        # Built once per added field instead of from the list of dicts on every rerun.
+        if len(state.metadata_cells_df) != len(state.metadata_cells):
+            state.metadata_cells_df = pd.DataFrame(state.metadata_cells)
+        st.dataframe(state.metadata_cells_df, use_container_width=True)
+        if st.button("Clear Metadata Fields"):
+            state.metadata_cells = []
+            state.metadata_cells_df = pd.DataFrame()
+            _rerun_fragment()
+
+
 def render() -> None:
     state = SessionState(DEFAULTS)
 
@@ -76,6 +216,7 @@ def render() -> None:
     if uploaded.name != state.uploaded_name:
         state.uploaded_name = uploaded.name
         state.uploaded_bytes = uploaded.getvalue()
+        state.uploaded_hash = content_digest(state.uploaded_bytes)
         state.sheet_name = None
         state.selected_column = None
         state.mappings = {}
@@ -107,9 +248,12 @@ def render() -> None:
         state.skiprows = skiprows_text
 
         if is_excel:
-            sheets = list_excel_sheets(state.uploaded_bytes)
-            if not sheets:
-                sheets = ["Sheet1"]
+            # Sheet names are fixed per upload; keep them with the digest they belong to
+            # (the upload may have come from another page).
+            digest, sheets = state.upload_sheets
+            if digest != state.uploaded_hash:
+                sheets = list_excel_sheets(state.uploaded_bytes, state.uploaded_hash) or ["Sheet1"]
+                state.upload_sheets = (state.uploaded_hash, sheets)
             if state.sheet_name not in sheets:
                 state.sheet_name = sheets[0]
             state.sheet_name = st.selectbox("Sheet", sheets, index=sheets.index(state.sheet_name))
@@ -122,158 +266,53 @@ def render() -> None:
 
     with left:
         st.subheader("Preview")
-        progress = st.progress(0)
-        read_ok = False
         try:
-            progress.progress(20)
-            skiprows = parse_skiprows(state.skiprows)
-            df = read_uploaded_dataframe(
-                state.uploaded_bytes,
-                state.uploaded_name,
-                int(state.header_row),
-                skiprows,
-                state.delimiter,
-                state.encoding,
-                state.sheet_name,
-                nrows=200,
-            )
-            progress.progress(80)
-            read_ok = True
+            with st.spinner("Parsing preview..."):
+                skiprows = tuple(parse_skiprows(state.skiprows))
+                df = read_uploaded_dataframe(
+                    state.uploaded_bytes,
+                    state.uploaded_hash,
+                    state.uploaded_name,
+                    int(state.header_row),
+                    skiprows,
+                    state.delimiter,
+                    state.encoding,
+                    state.sheet_name,
+                    nrows=200,
+                )
         except Exception as exc:
-            progress.empty()
             st.error(f"Unable to parse file: {exc}")
             return
-        finally:
-            if read_ok:
-                progress.progress(100)
-                progress.empty()
 
         tab_data, tab_meta = st.tabs(
             ["Table Columns (Data)", "Metadata Cells (Titles/Dates)"]
         )
 
         with tab_data:
-            selection = _render_dataframe_selection(df)
-            selected = _extract_selected_column(selection)
-
-            if selected:
-                state.selected_column = selected
-            elif state.selected_column not in df.columns:
-                state.selected_column = None
-
-            if state.selected_column:
-                st.success(f"Selected column: {state.selected_column}")
-            else:
-                fallback = st.selectbox(
-                    "Select a column to map",
-                    options=["(none)"] + list(df.columns),
-                )
-                state.selected_column = None if fallback == "(none)" else fallback
+            _preview_fragment(df, state)
 
         with tab_meta:
             st.subheader("Metadata Cells")
             st.caption("Select a cell to capture titles, dates, or other metadata.")
 
-            selected_row_idx = None
-            selected_col_idx = None
-            try:
+            # The raw grid ignores header/skip settings, so most reruns can reuse it
+            # straight from session state without touching the data cache.
+            meta_signature = (state.uploaded_hash, state.delimiter, state.encoding, state.sheet_name)
+            signature, raw_df = state.meta_raw
+            if signature != meta_signature:
                 raw_df = read_uploaded_dataframe(
                     state.uploaded_bytes,
+                    state.uploaded_hash,
                     state.uploaded_name,
                     header_row=None,
-                    skiprows=[],
+                    skiprows=(),
                     delimiter=state.delimiter,
                     encoding=state.encoding,
                     sheet_name=state.sheet_name,
                     nrows=200,
                 )
-                display_df = raw_df.copy()
-                display_df.columns = [f"Col {idx}" for idx in range(len(raw_df.columns))]
-                meta_event = st.dataframe(
-                    display_df,
-                    use_container_width=True,
-                    on_select="rerun",
-                    selection_mode=["single-row", "single-column"],
-                    height=240,
-                )
-                if meta_event.selection.rows:
-                    selected_row_idx = int(meta_event.selection.rows[0])
-                if meta_event.selection.columns:
-                    col_name = meta_event.selection.columns[0]
-                    if col_name in display_df.columns:
-                        selected_col_idx = int(display_df.columns.get_loc(col_name))
-            except TypeError:
-                st.caption("Selection API not available; using dropdowns.")
-                raw_df = read_uploaded_dataframe(
-                    state.uploaded_bytes,
-                    state.uploaded_name,
-                    header_row=None,
-                    skiprows=[],
-                    delimiter=state.delimiter,
-                    encoding=state.encoding,
-                    sheet_name=state.sheet_name,
-                    nrows=200,
-                )
-                selected_row_idx = st.selectbox(
-                    "Row", options=list(range(len(raw_df))), index=0 if len(raw_df) else 0
-                )
-                selected_col_idx = st.selectbox(
-                    "Column",
-                    options=list(range(len(raw_df.columns))),
-                    format_func=lambda idx: f"Col {idx}",
-                    index=0 if len(raw_df.columns) else 0,
-                )
-
-            cell_value = None
-            if selected_row_idx is not None and selected_col_idx is not None:
-                state.meta_row_idx = selected_row_idx
-                state.meta_col_idx = selected_col_idx
-                col_name = f"Col {selected_col_idx}"
-                cell_value = raw_df.iat[selected_row_idx, selected_col_idx]
-                st.write(
-                    f"Selected cell: Row {selected_row_idx}, Column {col_name} -> `{cell_value}`"
-                )
-            else:
-                st.info("Select a row and column to capture metadata.")
-
-            state.meta_target = st.text_input(
-                "Metadata target name", value=state.meta_target
-            )
-            state.meta_type = st.selectbox(
-                "Metadata type",
-                options=["metadata", "title", "date", "header_def"],
-                index=["metadata", "title", "date", "header_def"].index(state.meta_type),
-            )
-
-            if cell_value is None and state.meta_row_idx is not None and state.meta_col_idx is not None:
-                try:
-                    cell_value = raw_df.iat[int(state.meta_row_idx), int(state.meta_col_idx)]
-                except Exception:
-                    cell_value = None
-
-            add_disabled = (
-                state.meta_row_idx is None
-                or state.meta_col_idx is None
-                or not state.meta_target.strip()
-            )
-            if st.button("Add Metadata Field", disabled=add_disabled):
-                entry = {
-                    "row": int(state.meta_row_idx),
-                    "col": int(state.meta_col_idx),
-                    "value": "" if cell_value is None else str(cell_value),
-                    "target": state.meta_target.strip(),
-                    "metadata_type": state.meta_type,
-                }
-                state.metadata_cells = state.metadata_cells + [entry]
-                state.meta_target = ""
-                st.toast("Metadata field added.") if hasattr(st, "toast") else st.success(
-                    "Metadata field added."
-                )
-
-            if state.metadata_cells:
-                st.dataframe(state.metadata_cells, use_container_width=True)
-                if st.button("Clear Metadata Fields"):
-                    state.metadata_cells = []
+                state.meta_raw = (meta_signature, raw_df)
+            _metadata_fragment(raw_df, state)
 
         st.caption(f"{len(df)} rows x {len(df.columns)} columns (preview)")
         if df.empty:
@@ -2,12 +2,18 @@ from __future__ import annotations
 
 import re
 from difflib import SequenceMatcher
+from functools import lru_cache
 
 import pandas as pd
 import streamlit as st
 from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_numeric_dtype
 
-from src.core.config_loader import load_synonyms
+try:  # RapidFuzz scores in C++; difflib is the pure-Python fallback.
+    from rapidfuzz import fuzz, process
+except ImportError:  # pragma: no cover - optional dependency
+    fuzz = process = None
+
+from src.core.config_loader import load_synonyms, synonyms_signature
 from src.core.state import SessionState
 from src.core.streamlit_io import read_uploaded_dataframe
 from src.templates import parse_skiprows
@@ -16,6 +22,7 @@ from src.templates import parse_skiprows
 DEFAULTS = {
     "uploaded_name": None,
     "uploaded_bytes": None,
+    "uploaded_hash": None,
     "header_row": 0,
     "skiprows": "",
     "delimiter": ",",
@@ -26,23 +33,46 @@ DEFAULTS = {
 }
 
 
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=8192)
 def _normalize(text: str) -> str:
-    cleaned = re.sub(r"[^a-z0-9]+", " ", text.lower())
-    return re.sub(r"\s+", " ", cleaned).strip()
+    # The greedy class already collapses runs, so one sub is enough.
+    return _NON_ALNUM.sub(" ", text.lower()).strip()
+
+
+def _synonym_choices(synonyms: dict[str, list[str]]) -> tuple[list[str], list[str]]:
+    """Flatten targets and their terms into parallel (target, normalized term) lists once per run."""
+    targets: list[str] = []
+    terms: list[str] = []
+    for target, target_terms in synonyms.items():
+        for term in [target, *target_terms]:
+            targets.append(target)
+            terms.append(_normalize(term))
+    return targets, terms
 
 
-def _best_target(source: str, synonyms: dict[str, list[str]]) -> str | None:
+@st.cache_data(show_spinner=False)
+def _cached_synonym_choices(signature: tuple[int, int]) -> tuple[list[str], list[str]]:
+    """Flattened synonym choices, shared across reruns until the synonym files change."""
+    return _synonym_choices(load_synonyms())
+
+
+def _best_target(source: str, choices: tuple[list[str], list[str]]) -> str | None:
+    targets, terms = choices
     source_norm = _normalize(source)
+    if process is not None:
+        match = process.extractOne(source_norm, terms, scorer=fuzz.ratio, score_cutoff=60)
+        return targets[match[2]] if match else None
+
     best_score = 0.0
     best_target = None
-
-    for target, terms in synonyms.items():
-        candidates = [target] + list(terms)
-        for term in candidates:
-            score = SequenceMatcher(None, source_norm, _normalize(term)).ratio()
-            if score > best_score:
-                best_score = score
-                best_target = target
+    for target, term_norm in zip(targets, terms):
+        score = SequenceMatcher(None, source_norm, term_norm).ratio()
+        if score > best_score:
+            best_score = score
+            best_target = target
 
     return best_target if best_score >= 0.6 else None
 
@@ -88,6 +118,7 @@ def render() -> None:
         skiprows = parse_skiprows(state.skiprows)
         df = read_uploaded_dataframe(
             state.uploaded_bytes,
+            state.uploaded_hash,
             state.uploaded_name,
             int(state.header_row),
             skiprows,
@@ -109,8 +140,9 @@ def render() -> None:
     top_row = st.columns([1, 3])
     with top_row[0]:
         if st.button("Auto-Suggest", use_container_width=True):
+            choices = _cached_synonym_choices(synonyms_signature())
             for col in df.columns:
-                suggestion = _best_target(str(col), synonyms)
+                suggestion = _best_target(str(col), choices)
                 key = f"map_{col}"
                 if suggestion:
                     st.session_state[key] = suggestion
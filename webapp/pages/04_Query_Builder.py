@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import json
+
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -11,12 +14,15 @@ from src.templates import parse_skiprows
 DEFAULTS = {
     "uploaded_name": None,
     "uploaded_bytes": None,
+    "uploaded_hash": None,
     "header_row": 0,
     "skiprows": "",
     "delimiter": ",",
     "encoding": "utf-8",
     "sheet_name": None,
     "query_text": "",
+    "query_params": [],
+    "sql_key": None,
     "selected_columns": [],
     "filters": [
         {"column": "", "operator": "=", "value": ""},
@@ -25,10 +31,21 @@ DEFAULTS = {
     "auto_sync": True,
 }
 
+_OPS = {
+    "=": np.equal,
+    "!=": np.not_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+}
+
 
-def _build_sql(selected_cols: list[str], filters: list[dict]) -> str:
+def _build_sql(selected_cols: list[str], filters: list[dict]) -> tuple[str, list[str]]:
+    """Return parameterised SQL with ``?`` placeholders and its positional values."""
     select_clause = ", ".join(selected_cols) if selected_cols else "*"
     where_parts: list[str] = []
+    params: list[str] = []
     for item in filters:
         col = str(item.get("column", "")).strip()
         op = str(item.get("operator", "")).strip() or "="
@@ -36,43 +53,57 @@ def _build_sql(selected_cols: list[str], filters: list[dict]) -> str:
         if not col or not val:
             continue
         if op.lower() == "contains":
-            where_parts.append(f"{col} LIKE '%{val}%'")
+            where_parts.append(f"{col} LIKE ?")
+            params.append(f"%{val}%")
         else:
-            where_parts.append(f"{col} {op} '{val}'")
+            where_parts.append(f"{col} {op} ?")
+            params.append(val)
     where_clause = f" WHERE {' AND '.join(where_parts)}" if where_parts else ""
-    return f"SELECT {select_clause} FROM data{where_clause};"
+    return f"SELECT {select_clause} FROM data{where_clause};", params
+
+
+def _as_mask(result: object) -> np.ndarray:
+    if isinstance(result, pd.Series):
+        return result.to_numpy(dtype=bool, na_value=False)
+    return np.asarray(result, dtype=bool)
 
 
 def _apply_filters(df: pd.DataFrame, filters: list[dict]) -> pd.DataFrame:
-    filtered = df.copy()
-    for item in filters:
+    # AND every filter into one mask and slice the frame once at the end.
+    active = [f for f in filters if f.get("column") and str(f.get("value", "")).strip()]
+    if not active:
+        return df
+    mask = np.ones(len(df), dtype=bool)
+    numeric: dict[str, bool] = {}
+    for item in active:
         col = str(item.get("column", "")).strip()
-        op = str(item.get("operator", "")).strip() or "="
+        op = (str(item.get("operator", "")).strip() or "=").lower()
         raw_val = str(item.get("value", "")).strip()
-        if not col or col not in filtered.columns or raw_val == "":
+        if not col or col not in df.columns or raw_val == "":
             continue
-        series = filtered[col]
+        series = df[col]
+        is_numeric = numeric.get(col)
+        if is_numeric is None:
+            is_numeric = numeric[col] = pd.api.types.is_numeric_dtype(series)
         val: object = raw_val
-        if pd.api.types.is_numeric_dtype(series):
+        values: object = series
+        if is_numeric:
             try:
                 val = float(raw_val)
             except ValueError:
                 continue
-        if op == "=":
-            filtered = filtered[series == val]
-        elif op == "!=":
-            filtered = filtered[series != val]
-        elif op == ">":
-            filtered = filtered[series > val]
-        elif op == ">=":
-            filtered = filtered[series >= val]
-        elif op == "<":
-            filtered = filtered[series < val]
-        elif op == "<=":
-            filtered = filtered[series <= val]
-        elif op.lower() == "contains":
-            filtered = filtered[series.astype(str).str.contains(str(val), na=False)]
-    return filtered
+            values = series.to_numpy(dtype=float, na_value=np.nan)
+        if op == "contains":
+            # String columns are searched in place; only other dtypes need stringifying.
+            text = series if pd.api.types.is_string_dtype(series) else series.astype(str)
+            op_mask = text.str.contains(str(val), na=False, regex=False)
+        else:
+            op_fn = _OPS.get(op)
+            if op_fn is None:
+                continue
+            op_mask = op_fn(values, val)
+        mask &= _as_mask(op_mask)
+    return df if mask.all() else df[mask]
 
 
 def render() -> None:
@@ -92,9 +123,10 @@ def render() -> None:
         return
 
     try:
-        skiprows = parse_skiprows(state.skiprows)
+        skiprows = tuple(parse_skiprows(state.skiprows))
         df = read_uploaded_dataframe(
             state.uploaded_bytes,
+            state.uploaded_hash,
             state.uploaded_name,
             int(state.header_row),
             skiprows,
@@ -111,6 +143,8 @@ def render() -> None:
         st.warning("Preview is empty. Adjust header row or delimiter settings.")
         return
 
+    columns = list(df.columns)
+
     left, right = st.columns([3, 2], gap="large")
 
     with left:
@@ -120,7 +154,7 @@ def render() -> None:
     with right:
         st.subheader("Source Canvas")
 
-        column_df = pd.DataFrame({"column": list(df.columns)})
+        column_df = pd.DataFrame({"column": columns})
         selected_col = None
         try:
             st.data_editor(
@@ -137,21 +171,25 @@ def render() -> None:
         except TypeError:
             selected_col = st.selectbox(
                 "Select a column",
-                options=list(df.columns),
+                options=columns,
                 index=0,
             )
 
         if selected_col and selected_col != state.last_selected_column:
             state.last_selected_column = selected_col
-            if selected_col not in state.selected_columns:
-                state.selected_columns = state.selected_columns + [selected_col]
+            # Rebind instead of appending: the default list object is shared via DEFAULTS.
+            selected = state.selected_columns
+            if selected_col not in selected:
+                state.selected_columns = [*selected, selected_col]
 
         st.subheader("Query Canvas")
-        state.selected_columns = st.multiselect(
+        chosen = st.multiselect(
             "Select columns",
-            options=list(df.columns),
+            options=columns,
             default=state.selected_columns,
         )
+        if chosen != state.selected_columns:
+            state.selected_columns = chosen
 
         filter_df = pd.DataFrame(state.filters)
         edited = st.data_editor(
@@ -161,7 +199,7 @@ def render() -> None:
             column_config={
                 "column": st.column_config.SelectboxColumn(
                     "Column",
-                    options=[""] + list(df.columns),
+                    options=["", *columns],
                 ),
                 "operator": st.column_config.SelectboxColumn(
                     "Operator",
@@ -169,20 +207,32 @@ def render() -> None:
                 ),
             },
         )
-        state.filters = edited.to_dict(orient="records")
+        new_filters = edited.to_dict(orient="records")
+        if new_filters != state.filters:
+            state.filters = new_filters
 
         state.auto_sync = st.checkbox(
             "Auto-sync SQL with selections",
             value=state.auto_sync,
         )
         if state.auto_sync:
-            state.query_text = _build_sql(state.selected_columns, state.filters)
+            sql_key = (
+                tuple(state.selected_columns),
+                json.dumps(state.filters, sort_keys=True, default=str),
+            )
+            if sql_key != state.sql_key:
+                state.query_text, state.query_params = _build_sql(
+                    state.selected_columns, state.filters
+                )
+                state.sql_key = sql_key
 
         state.query_text = st.text_area(
             "Generated SQL",
             value=state.query_text,
             height=120,
         )
+        if state.query_params:
+            st.caption(f"Parameters: {state.query_params!r}")
         st.caption("Copy the SQL text above into your query tool.")
 
         palette = st.columns(6)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -12,6 +13,7 @@ from src.templates import Template, parse_skiprows
 DEFAULTS = {
     "uploaded_name": None,
     "uploaded_bytes": None,
+    "uploaded_hash": None,
     "header_row": 0,
     "skiprows": "",
     "delimiter": ",",
@@ -51,6 +53,11 @@ def _generate_cli(
     return cmd
 
 
+def _top_k_counts(series: pd.Series, k: int = 25) -> pd.Series:
+    # Hash-count without sorting every distinct value, then select only the top k.
+    return series.value_counts(sort=False).nlargest(k)
+
+
 def render() -> None:
     state = SessionState(DEFAULTS)
 
@@ -68,9 +75,10 @@ def render() -> None:
         return
 
     try:
-        skiprows = parse_skiprows(state.skiprows)
+        skiprows = tuple(parse_skiprows(state.skiprows))
         df = read_uploaded_dataframe(
             state.uploaded_bytes,
+            state.uploaded_hash,
             state.uploaded_name,
             int(state.header_row),
             skiprows,
@@ -91,7 +99,7 @@ def render() -> None:
 
     row_count = len(df)
     col_count = len(df.columns)
-    null_count = int(df.isna().sum().sum())
+    null_count = int(np.count_nonzero(df.isna().to_numpy()))
 
     metrics = st.columns(3)
     metrics[0].metric("Rows", f"{row_count}")
@@ -107,12 +115,12 @@ def render() -> None:
 
     st.metric("Validation", validation_msg)
 
-    numeric_cols = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
+    numeric_cols = [c for c, dtype in df.dtypes.items() if pd.api.types.is_numeric_dtype(dtype)]
     chart_col = st.selectbox(
         "Chart column",
         options=numeric_cols if numeric_cols else list(df.columns),
     )
-    st.bar_chart(df[chart_col].value_counts().head(25))
+    st.bar_chart(_top_k_counts(df[chart_col]))
 
     st.subheader("Code Generator")
     state.validation_level = st.selectbox(
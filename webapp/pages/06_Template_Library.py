@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import streamlit as st
 
 from src.api.v1.engine import DataEngine
 from src.core.state import SessionState
+from src.exporter import write_excel
 from src.templates import load_template
 
 
@@ -14,6 +17,7 @@ DEFAULTS = {
     "selected_template": None,
     "input_dir": "data/input",
     "output_dir": "data/output",
+    "output_fmt": "parquet",
     "last_message": "",
     "combine_mode": "concat",
     "combine_keys": "",
@@ -21,13 +25,25 @@ DEFAULTS = {
     "combine_strict": False,
 }
 
+_MAX_BATCH_WORKERS = 8
+
 
 def _find_templates() -> list[Path]:
     roots = [Path("data"), Path("data/schemas"), Path("data/input")]
     templates: list[Path] = []
     for root in roots:
-        if root.exists():
-            templates.extend(sorted(root.glob("*.df-template.json")))
+        if not root.is_dir():
+            continue
+        with os.scandir(root) as it:
+            templates.extend(
+                sorted(
+                    Path(entry.path)
+                    for entry in it
+                    if entry.name.endswith(".df-template.json")
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                )
+            )
     return templates
 
 
@@ -99,6 +115,12 @@ def render() -> None:
             st.rerun()
 
     st.subheader("Batch Operations")
+    state.output_fmt = st.selectbox(
+        "Batch output format",
+        options=["parquet", "xlsx"],
+        index=["parquet", "xlsx"].index(state.output_fmt),
+    )
+
     state.combine_mode = st.selectbox(
         "Combine mode",
         options=["concat", "merge"],
@@ -123,15 +145,13 @@ def render() -> None:
             keys = [k.strip() for k in state.combine_keys.split(",") if k.strip()]
             combined = engine.run_combine(
                 input_dir=Path(state.output_dir),
-                pattern="*.xlsx",
+                pattern=f"*.{state.output_fmt}",
                 mode=state.combine_mode,
                 keys=keys,
                 how=state.combine_how,
                 strict_schema=state.combine_strict,
             )
-            out_path = Path(state.output_dir) / "Master_Combined_Output.xlsx"
-            out_path.parent.mkdir(parents=True, exist_ok=True)
-            combined.to_excel(out_path, index=False)
+            out_path = write_excel(combined, Path(state.output_dir) / "Master_Combined_Output.xlsx")
             st.success(f"Combined output saved to {out_path}")
         except Exception as exc:
             st.error(f"Combine failed: {exc}")
@@ -145,19 +165,28 @@ def render() -> None:
             return
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        results = []
-        for file_path in files:
+        suffix = ".parquet" if state.output_fmt == "parquet" else ".xlsx"
+
+        def _process_one(file_path: Path) -> tuple[str, str]:
+            # run_full_process only records output_path; the frame is written once here.
+            out_path = output_dir / f"{file_path.stem}_clean{suffix}"
             result, df = engine.run_full_process(
                 source_path=file_path,
                 template=template,
-                output_path=output_dir / f"{file_path.stem}_clean.xlsx",
+                output_path=out_path,
             )
-            if result.success and df is not None:
-                out_path = output_dir / f"{file_path.stem}_clean.xlsx"
-                df.to_excel(out_path, index=False)
-                results.append((file_path.name, "ok"))
+            if not result.success or df is None:
+                return file_path.name, "failed"
+            if suffix == ".parquet":
+                df.to_parquet(out_path, index=False, engine="pyarrow", compression="zstd")
             else:
-                results.append((file_path.name, "failed"))
+                write_excel(df, out_path)
+            return file_path.name, "ok"
+
+        # Files are independent; overlap their reads and writes. Session state is
+        # only touched on this thread.
+        with ThreadPoolExecutor(max_workers=min(_MAX_BATCH_WORKERS, len(files))) as pool:
+            results = list(pool.map(_process_one, files))
 
         st.success("Batch processing complete.")
         st.dataframe(results, use_container_width=True)
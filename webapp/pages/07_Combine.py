@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import io
+import os
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import streamlit as st
 
-from src.combine_runner import concat_frames, merge_frames
+from src.combine_runner import check_schema_headers, join_frames, read_frame, stack_frames
 from src.core.state import SessionState
 
 
@@ -18,14 +22,73 @@ DEFAULTS = {
 }
 
 
+_OUTPUT_SUFFIXES = (".xlsx", ".xls", ".parquet")
+
+
 def _list_output_files(base_dir: Path) -> list[Path]:
-    patterns = ["*.xlsx", "*.xls", "*.parquet"]
-    files: list[Path] = []
-    for pattern in patterns:
-        files.extend(sorted(base_dir.glob(pattern)))
+    """Output files grouped by suffix (xlsx, xls, parquet), from one directory scan."""
+    if not base_dir.is_dir():
+        return []
+    with os.scandir(base_dir) as it:
+        files = [
+            Path(entry.path)
+            for entry in it
+            if not entry.name.startswith(".")
+            and entry.name.endswith(_OUTPUT_SUFFIXES)
+            and entry.is_file()
+        ]
+    files.sort(key=lambda path: (_OUTPUT_SUFFIXES.index(path.suffix), path))
     return files
 
 
+# mtime and size are part of the cache key so a rewritten output file is re-read.
+@st.cache_data(show_spinner=False, max_entries=32)
+def _read_one(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    return read_frame(Path(path))
+
+
+def _load_frames(paths: list[Path]) -> list[pd.DataFrame]:
+    frames = []
+    for path in paths:
+        stat = path.stat()
+        frames.append(_read_one(str(path), stat.st_mtime_ns, stat.st_size))
+    return frames
+
+
+def _coarsen_timestamps(table: pa.Table) -> pa.Table:
+    """Cast timestamp columns to the coarsest of s/ms/us that loses nothing.
+
+    Arrow writes nanosecond timestamps with nine fractional digits, which Excel reads as text.
+    """
+    for idx, field in enumerate(table.schema):
+        if not pa.types.is_timestamp(field.type):
+            continue
+        for unit in ("s", "ms", "us"):
+            try:
+                column = table.column(idx).cast(pa.timestamp(unit, tz=field.type.tz))
+            except pa.ArrowInvalid:
+                continue
+            table = table.set_column(idx, field.with_type(column.type), column)
+            break
+    return table
+
+
+def _csv_bytes(df: pd.DataFrame) -> bytes:
+    """Encode ``df`` as UTF-8 CSV with Arrow's multi-threaded writer, else pandas.
+
+    Only fields that need it are quoted and timestamps keep the shortest exact precision,
+    so the download stays close to ``to_csv``; booleans are written as ``true``/``false``.
+    """
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # Object columns mixing types have no Arrow equivalent.
+        return df.to_csv(index=False).encode("utf-8")
+    buf = io.BytesIO()
+    pa_csv.write_csv(_coarsen_timestamps(table), buf, pa_csv.WriteOptions(quoting_style="needed"))
+    return buf.getvalue()
+
+
 def render() -> None:
     state = SessionState(DEFAULTS)
 
@@ -78,17 +141,27 @@ def render() -> None:
 
     if st.button("Run Combine", use_container_width=True):
         try:
+            if (
+                state.combine_mode == "concat"
+                and state.strict_schema
+                and all(p.suffix.lower() == ".parquet" for p in selected_paths)
+            ):
+                # Parquet footers give the schema without reading any row groups.
+                check_schema_headers(selected_paths)
+            frames = _load_frames(selected_paths)
             if state.combine_mode == "concat":
-                combined = concat_frames(selected_paths, strict_schema=state.strict_schema)
+                combined = stack_frames(selected_paths, frames, strict_schema=state.strict_schema)
             else:
                 keys = [k.strip() for k in state.combine_keys.split(",") if k.strip()]
-                combined = merge_frames(selected_paths, keys=keys, how=state.combine_how)
+                combined = join_frames(
+                    frames, keys=keys, how=state.combine_how, files=selected_paths
+                )
         except Exception as exc:
             st.error(f"Combine failed: {exc}")
             return
 
         st.dataframe(combined, use_container_width=True)
-        csv_bytes = combined.to_csv(index=False).encode("utf-8")
+        csv_bytes = _csv_bytes(combined)
         st.download_button(
             "Download CSV",
             data=csv_bytes,
@@ -1,67 +1,142 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import streamlit as st
 
+from src.exporter import write_excel
 from src.youtube import YouTubeAuthError, add_engagement_metrics, build_summaries, fetch_videos_dataframe
 
-DETAIL_PATH = Path("data/output/youtube_detail.xlsx")
-SUMMARY_PATH = Path("data/output/youtube_summary.xlsx")
+OUTPUT_DIR = Path("data/output")
+DETAIL_PATH = OUTPUT_DIR / "youtube_detail.parquet"
+DETAIL_XLSX_PATH = OUTPUT_DIR / "youtube_detail.xlsx"
+SUMMARY_XLSX_PATH = OUTPUT_DIR / "youtube_summary.xlsx"
+DIGEST_PATH = OUTPUT_DIR / ".youtube_detail_hash"
+_SUMMARY_SHEETS = ("top_videos", "per_channel", "per_year")
+_MAX_PARALLEL_SOURCES = 8
+
+
+def _summary_path(name: str) -> Path:
+    return OUTPUT_DIR / f"youtube_summary_{name}.parquet"
+
+
+def _parquet_head(path: Path, n: int) -> tuple[pd.DataFrame, int]:
+    """First ``n`` rows and the total row count, decoding only the first batch."""
+    parquet_file = pq.ParquetFile(path)
+    batch = next(parquet_file.iter_batches(batch_size=n), None)
+    if batch is None:
+        return parquet_file.schema_arrow.empty_table().to_pandas(), 0
+    return pa.Table.from_batches([batch]).to_pandas(), parquet_file.metadata.num_rows
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _read_detail(path: str, mtime_ns: int) -> tuple[pd.DataFrame, int]:
+    return _parquet_head(Path(path), 5)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _read_summaries(mtimes: tuple[tuple[str, int], ...]) -> dict[str, pd.DataFrame]:
+    return {name: _parquet_head(_summary_path(name), 10)[0] for name, _ in mtimes}
+
+
+def _export_excel() -> None:
+    write_excel(pd.read_parquet(DETAIL_PATH), DETAIL_XLSX_PATH)
+    summaries = {
+        name: pd.read_parquet(_summary_path(name))
+        for name in _SUMMARY_SHEETS
+        if _summary_path(name).exists()
+    }
+    if summaries:
+        write_excel(summaries, SUMMARY_XLSX_PATH)
 
 
 def _display_existing() -> None:
+    # Reads are cached on mtime, so reruns between fetches don't re-read the files.
     st.subheader("Current demo data")
     if DETAIL_PATH.exists():
-        df = pd.read_excel(DETAIL_PATH)
-        st.success(f"Detail file found: {DETAIL_PATH} ({len(df)} rows)")
-        st.dataframe(df.head(5), use_container_width=True, hide_index=True)
+        head, row_count = _read_detail(str(DETAIL_PATH), DETAIL_PATH.stat().st_mtime_ns)
+        st.success(f"Detail file found: {DETAIL_PATH} ({row_count} rows)")
+        st.dataframe(head, use_container_width=True, hide_index=True)
+        if st.button("Export to Excel"):
+            _export_excel()
+            st.success(f"Exported {DETAIL_XLSX_PATH} and {SUMMARY_XLSX_PATH}")
     else:
         st.info("No detail file yet. Run the fetch form below.")
 
-    if SUMMARY_PATH.exists():
+    mtimes = tuple(
+        (name, _summary_path(name).stat().st_mtime_ns)
+        for name in _SUMMARY_SHEETS
+        if _summary_path(name).exists()
+    )
+    if mtimes:
         try:
-            xl = pd.ExcelFile(SUMMARY_PATH)
-            for name in ["top_videos", "per_channel", "per_year"]:
-                if name in xl.sheet_names:
-                    st.caption(f"Summary: {name}")
-                    st.dataframe(xl.parse(name).head(10), use_container_width=True, hide_index=True)
+            for name, frame in _read_summaries(mtimes).items():
+                st.caption(f"Summary: {name}")
+                st.dataframe(frame, use_container_width=True, hide_index=True)
         except Exception as exc:  # pragma: no cover - UI guardrail
-            st.warning(f"Could not read summary workbook: {exc}")
+            st.warning(f"Could not read summary files: {exc}")
     else:
-        st.info("No summary workbook yet.")
+        st.info("No summary files yet.")
 
 
 def _fetch_and_save(playlists: list[str], channels: list[str], max_results: int, top_n: int, api_key: str | None) -> dict[str, pd.DataFrame]:
-    frames: list[pd.DataFrame] = []
-
-    for pid in playlists:
-        df = fetch_videos_dataframe(playlist_id=pid, max_results=max_results, api_key=api_key)
-        df["source"] = f"playlist:{pid}"
-        frames.append(df)
+    sources = [("playlist", pid) for pid in playlists] + [("channel", cid) for cid in channels]
 
-    for cid in channels:
-        df = fetch_videos_dataframe(channel_id=cid, max_results=max_results, api_key=api_key)
-        df["source"] = f"channel:{cid}"
-        frames.append(df)
+    def _fetch(source: tuple[str, str]) -> pd.DataFrame:
+        kind, source_id = source
+        df = fetch_videos_dataframe(**{f"{kind}_id": source_id}, max_results=max_results, api_key=api_key)
+        df["source"] = f"{kind}:{source_id}"
+        return df
 
-    combined = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=[])
+    # Each source is an independent chain of API round-trips; overlap them.
+    frames: list[pd.DataFrame] = []
+    if sources:
+        with ThreadPoolExecutor(max_workers=min(_MAX_PARALLEL_SOURCES, len(sources))) as pool:
+            frames = list(pool.map(_fetch, sources))
+
+    # Drop videos already seen in an earlier source (or earlier in the same one) before
+    # concatenating, so duplicate rows are never copied into the combined frame.
+    seen: set[str] = set()
+    unique_frames: list[pd.DataFrame] = []
+    for df in frames:
+        ids = df["video_id"]
+        keep = ~(ids.isin(seen) | ids.duplicated())
+        seen.update(ids[keep])
+        unique_frames.append(df if keep.all() else df[keep])
+
+    combined = pd.concat(unique_frames, ignore_index=True) if unique_frames else pd.DataFrame(columns=[])
     if combined.empty:
         return {"detail": combined, "top_videos": pd.DataFrame(), "per_channel": pd.DataFrame(), "per_year": pd.DataFrame()}
 
-    combined = combined.drop_duplicates(subset=["video_id"])
     combined = add_engagement_metrics(combined)
-    combined = combined.sort_values(by=["view_count", "like_count"], ascending=False)
 
     summaries = build_summaries(combined, top_n=top_n)
-    DETAIL_PATH.parent.mkdir(parents=True, exist_ok=True)
-    combined.to_excel(DETAIL_PATH, index=False)
+    # Refetching the same sources often returns identical rows. A sidecar next to the
+    # outputs records what was last written (across sessions), so unchanged files are kept.
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(combined.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(combined, index=False).to_numpy().tobytes())
+    written = {"detail": digest.hexdigest(), "top_n": top_n}
+    try:
+        previous = json.loads(DIGEST_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        previous = {}
 
-    with pd.ExcelWriter(SUMMARY_PATH) as writer:
-        for name, frame in summaries.items():
-            frame.to_excel(writer, sheet_name=name[:31], index=False)
+    DETAIL_PATH.parent.mkdir(parents=True, exist_ok=True)
+    if previous.get("detail") != written["detail"] or not DETAIL_PATH.exists():
+        combined.to_parquet(DETAIL_PATH, index=False, compression="zstd")
+    summary_paths = {name: _summary_path(name) for name in _SUMMARY_SHEETS}
+    if previous != written or not all(path.exists() for path in summary_paths.values()):
+        for name, path in summary_paths.items():
+            summaries[name].to_parquet(path, index=False, compression="zstd")
+    DIGEST_PATH.write_text(json.dumps(written), encoding="utf-8")
 
     return summaries | {"detail": combined}
 
@@ -98,7 +173,7 @@ def render() -> None:
                 st.error(f"Fetch failed: {exc}")
                 return
 
-        st.success(f"Saved detail to {DETAIL_PATH} and summary to {SUMMARY_PATH}")
+        st.success(f"Saved detail to {DETAIL_PATH} and summaries to {OUTPUT_DIR}")
         st.metric("Sources requested", len(playlist_ids) + len(channel_ids))
         if summaries["detail"].empty:
             st.info("No videos returned.")